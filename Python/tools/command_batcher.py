@@ -0,0 +1,228 @@
+"""
+Command batching for Unreal MCP tools.
+
+Write-heavy tools submit their commands through a CommandBatcher so that calls arriving
+together reach Unreal Engine as one "<command>_batch" request instead of one round trip each.
+The unreal_tool decorator turns a params-building function into a tool that sends them.
+"""
+
+import asyncio
+import functools
+import inspect
+import itertools
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# Get logger
+logger = logging.getLogger("UnrealMCP")
+
+# Shared reply for an empty Unreal response; never mutate it. Constant replies like this one are
+# built once at import and returned as-is, with tuples for their lists (still sent as JSON arrays);
+# a read-only MappingProxyType is not an option because FastMCP cannot serialize it.
+NO_RESPONSE_ERROR = {"success": False, "message": "No response from Unreal Engine"}
+
+# Shared connection pool, bound on first use since the server module imports the tool modules
+_connection_pool = None
+
+def get_shared_pool():
+    """Return the server's shared connection pool, importing the server module only once."""
+    global _connection_pool
+    if _connection_pool is None:
+        from unreal_mcp_server import get_connection_pool
+        _connection_pool = get_connection_pool()
+    return _connection_pool
+
+# Most operations started with start_operation that may wait to be collected
+MAX_STARTED_OPERATIONS = 256
+
+# Operations started with start_operation by id, oldest first, until collect_operations returns them
+_started_operations: Dict[str, asyncio.Task] = {}
+_operation_ids = itertools.count(1)
+
+def start_operation(run: Callable[..., Awaitable[Any]], *args, **kwargs) -> str:
+    """
+    Start run(*args, **kwargs) without waiting for it and return an id for collect_operations.
+    
+    Raises RuntimeError if MAX_STARTED_OPERATIONS uncollected operations are still running.
+    """
+    if len(_started_operations) >= MAX_STARTED_OPERATIONS:
+        # Make room by dropping the oldest finished operations nobody collected
+        for op_id in [op_id for op_id, task in _started_operations.items() if task.done()]:
+            del _started_operations[op_id]
+            if len(_started_operations) < MAX_STARTED_OPERATIONS:
+                break
+        else:
+            raise RuntimeError(f"{MAX_STARTED_OPERATIONS} operations are still running; collect them first")
+    
+    op_id = f"op-{next(_operation_ids)}"
+    _started_operations[op_id] = asyncio.get_running_loop().create_task(run(*args, **kwargs))
+    return op_id
+
+def start_tool_operation(tool: Callable[..., Awaitable[Dict[str, Any]]], ctx: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Start an unreal_tool tool with params as keyword arguments, for the queue_*_operation tools.
+    
+    params are bound to the tool's signature first, so missing, unknown or None required
+    parameters are rejected before anything is queued. The tool then builds, checks and
+    sends its command exactly as a direct call would.
+    
+    Returns:
+        {"success": True, "operation_id": ...} or a failure response
+    """
+    signature = inspect.signature(tool)
+    try:
+        bound = signature.bind(ctx, **params)
+    except TypeError as e:
+        return {"success": False, "message": f"Invalid params for {tool.__name__}: {e}"}
+    
+    missing = [
+        name for name, value in bound.arguments.items()
+        if value is None and signature.parameters[name].default is inspect.Parameter.empty
+    ]
+    if missing:
+        return {"success": False, "message": f"Invalid params for {tool.__name__}: {', '.join(missing)} must not be None"}
+    
+    try:
+        operation_id = start_operation(tool, *bound.args, **bound.kwargs)
+    except RuntimeError as e:
+        return {"success": False, "message": str(e)}
+    
+    logger.info("Queued %s as %s", tool.__name__, operation_id)
+    return {"success": True, "operation_id": operation_id}
+
+async def collect_operations(operation_ids: List[str], timeout: float) -> Dict[str, Any]:
+    """
+    Wait up to timeout seconds for started operations and return their responses by id.
+    
+    Finished operations are forgotten once returned; ones still running are reported
+    as pending and can be collected again later.
+    """
+    tasks = [_started_operations[op_id] for op_id in operation_ids if op_id in _started_operations]
+    if tasks:
+        await asyncio.wait(tasks, timeout=timeout)
+    
+    results: Dict[str, Any] = {}
+    for op_id in operation_ids:
+        task = _started_operations.get(op_id)
+        if task is None:
+            results[op_id] = {"success": False, "message": f"Unknown operation id '{op_id}'"}
+        elif not task.done():
+            results[op_id] = {"success": False, "pending": True, "message": "Operation still running"}
+        else:
+            del _started_operations[op_id]
+            error = task.exception()
+            results[op_id] = {"success": False, "message": str(error)} if error else task.result()
+    return results
+
+class CommandBatcher:
+    """
+    Coalesce concurrent calls of the same command into one "<command>_batch" request.
+    
+    Calls queued within max_wait seconds of the first one (up to max_batch_size) are sent
+    together as {"batch": [params, ...]}; a lone call is sent as the plain command. If the
+    plugin does not know the batch command, the calls are replayed one at a time and that
+    command is no longer batched.
+    """
+    
+    def __init__(
+        self,
+        max_batch_size: int = 10,
+        max_wait: float = 0.025,
+        on_complete: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
+        """
+        Create a batcher with the given size and time triggers.
+        
+        on_complete is called with each call's params once its response arrived or it failed,
+        e.g. to drop caches the write made stale.
+        """
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.on_complete = on_complete
+        self._pending: Dict[str, List[Tuple[Dict[str, Any], asyncio.Future]]] = {}
+        self._unbatchable: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+    
+    async def submit(self, command: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Queue a call and wait for its individual response."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(command, [])
+        pending.append((params, future))
+        
+        if len(pending) >= self.max_batch_size:
+            self._flush(command)
+        elif len(pending) == 1:
+            loop.call_later(self.max_wait, self._flush, command)
+        
+        try:
+            return await future
+        finally:
+            if self.on_complete:
+                self.on_complete(params)
+    
+    def _flush(self, command: str):
+        """Start sending everything queued for command."""
+        calls = self._pending.pop(command, None)
+        if calls:
+            task = asyncio.create_task(self._send(command, calls))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _send(self, command: str, calls: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        """Send queued calls over one pooled connection and resolve their futures."""
+        try:
+            async with get_shared_pool().acquire() as unreal:
+                if len(calls) > 1 and command not in self._unbatchable:
+                    logger.info("Sending %d '%s' calls as one batch", len(calls), command)
+                    response = await unreal.send_command(f"{command}_batch", {"batch": [params for params, _ in calls]})
+                    
+                    if str(response.get("error", "")).startswith("Unknown command"):
+                        logger.info("Unreal does not support '%s_batch'; sending calls individually", command)
+                        self._unbatchable.add(command)
+                    else:
+                        result = response.get("result")
+                        results = result.get("results") if isinstance(result, dict) else response.get("results")
+                        aligned = isinstance(results, list) and len(results) == len(calls)
+                        for index, (_, future) in enumerate(calls):
+                            if not future.done():
+                                future.set_result(results[index] if aligned else response)
+                        return
+                
+                for params, future in calls:
+                    response = await unreal.send_command(command, params)
+                    if not future.done():
+                        future.set_result(response)
+        except Exception as e:
+            for _, future in calls:
+                if not future.done():
+                    future.set_exception(e)
+
+def unreal_tool(command: str, action: str, send: Callable[[str, Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]):
+    """
+    Turn a function that builds a command's params into an async tool that sends them.
+    
+    The wrapper keeps the decorated function's signature and docstring, so FastMCP still
+    derives the tool schema from it, and converts missing responses and exceptions into
+    {"success": False, "message": ...} results.
+    """
+    def decorator(build_params: Callable[..., Dict[str, Any]]):
+        @functools.wraps(build_params)
+        async def wrapper(*args, **kwargs) -> Dict[str, Any]:
+            # Only building (which may reject arguments with ValueError) and sending can fail
+            try:
+                response = await send(command, build_params(*args, **kwargs))
+            except Exception as e:
+                error_msg = f"Error {action}: {e}"
+                logger.error(error_msg)
+                return {"success": False, "message": error_msg}
+            
+            if not response:
+                logger.error("No response from Unreal Engine")
+                return NO_RESPONSE_ERROR
+            
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("%s response: %s", command, response)
+            return response
+        return wrapper
+    return decorator
@@ -17,17 +17,40 @@ Features:
 
 import os
 import json
+import hashlib
 import yaml
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, List
+from typing import Callable, Dict, Any, Optional, Union, List
 from dataclasses import dataclass, field
 from pydantic import BaseModel, Field, validator
 from enum import Enum
 
+# orjson is optional; the stdlib json module is used when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# watchdog is optional; without it, change checks fall back to comparing the file's mtime
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
 # Get logger
 logger = logging.getLogger("UnrealMCP.Config")
 
+def config_checksum(config_dict: Dict[str, Any]) -> str:
+    """Return a SHA-256 hex digest of a JSON-ready configuration dictionary, independent of key order."""
+    if orjson:
+        data = orjson.dumps(config_dict, option=orjson.OPT_SORT_KEYS)
+    else:
+        data = json.dumps(config_dict, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
 class LogLevel(str, Enum):
     """Supported log levels."""
     DEBUG = "DEBUG"
@@ -146,6 +169,18 @@ class UnrealMCPConfig(BaseModel):
             raise ValueError(f'Environment must be one of: {allowed}')
         return v
 
+class _ConfigFileEventHandler(FileSystemEventHandler):
+    """Forward file system events in the watched directory to a ConfigManager."""
+    
+    def __init__(self, manager: "ConfigManager"):
+        """Create a handler reporting to manager."""
+        super().__init__()
+        self.manager = manager
+    
+    def on_any_event(self, event):
+        """Let the manager check whether the event touched its config file."""
+        self.manager._on_file_event(event)
+
 class ConfigManager:
     """
     Configuration manager for Unreal MCP server.
@@ -172,6 +207,16 @@ class ConfigManager:
         self._config_file_path: Optional[Path] = None
         self._last_modified: Optional[float] = None
         
+        # JSON-ready dump of _config, rebuilt after any change
+        self._config_dict: Optional[Dict[str, Any]] = None
+        self._config_checksum: Optional[str] = None
+        
+        # File watcher state; _config_dirty is only meaningful while _observer is running
+        self._observer = None
+        self._watched_dir: Optional[Path] = None
+        self._config_dirty = False
+        self._on_change: Optional[Callable[[], None]] = None
+        
         # Configuration file search order
         self.config_files = [
             "unreal_mcp.yaml",
@@ -245,6 +290,8 @@ class ConfigManager:
                 if config_format == ConfigFormat.YAML:
                     return yaml.safe_load(f) or {}
                 elif config_format == ConfigFormat.JSON:
+                    if orjson:
+                        return orjson.loads(f.read())
                     return json.load(f)
                 elif config_format == ConfigFormat.TOML:
                     try:
@@ -337,9 +384,12 @@ class ConfigManager:
         if self._config_file_path:
             config_dict = self.load_config_file(self._config_file_path)
             self._last_modified = self._config_file_path.stat().st_mtime
+        self._config_dirty = False
         
         # Apply environment overrides
         config_dict = self.apply_environment_overrides(config_dict)
+        self._config_dict = None
+        self._config_checksum = None
         
         # Validate and create configuration object
         try:
@@ -363,6 +413,31 @@ class ConfigManager:
             return self.load_config()
         return self._config
     
+    def get_config_dict(self) -> Dict[str, Any]:
+        """
+        Get the current configuration as a JSON-ready dictionary.
+        
+        The dictionary is cached until the configuration changes and is shared
+        between callers, so it must not be modified.
+        
+        Returns:
+            Serialized current configuration
+        """
+        if self._config_dict is None:
+            self._config_dict = self.get_config().model_dump(mode="json")
+        return self._config_dict
+    
+    def get_config_checksum(self) -> str:
+        """
+        Get the checksum of the current configuration dictionary.
+        
+        Returns:
+            SHA-256 hex digest of get_config_dict(), as computed by config_checksum
+        """
+        if self._config_checksum is None:
+            self._config_checksum = config_checksum(self.get_config_dict())
+        return self._config_checksum
+    
     def reload_config(self) -> UnrealMCPConfig:
         """
         Reload configuration from file.
@@ -380,12 +455,83 @@ class ConfigManager:
         Returns:
             True if configuration has changed
         """
-        if not self._config_file_path or not self._config_file_path.exists():
+        if self._observer is not None:
+            return self._config_dirty
+        
+        if not self._config_file_path:
             return False
         
-        current_mtime = self._config_file_path.stat().st_mtime
+        # One stat answers both whether the file exists and when it was modified
+        try:
+            current_mtime = self._config_file_path.stat().st_mtime
+        except FileNotFoundError:
+            return False
         return current_mtime != self._last_modified
     
+    def start_watching(self, on_change: Optional[Callable[[], None]] = None) -> bool:
+        """
+        Watch the configuration file for changes with an OS-level file watcher.
+        
+        While watching, has_config_changed() reads a flag set by file events instead of
+        stat-ing the file. Calling this again is cheap and follows the config file if it
+        moved to another directory.
+        
+        Args:
+            on_change: Optional callback invoked (on the watcher thread) when the file changes
+            
+        Returns:
+            True if the file is being watched, False if watchdog is unavailable or no file is loaded
+        """
+        if Observer is None or not self._config_file_path:
+            return False
+        
+        self._on_change = on_change
+        watch_dir = self._config_file_path.resolve().parent
+        if self._observer is not None and self._watched_dir == watch_dir:
+            return True
+        
+        if self._observer is None:
+            self._observer = Observer()
+            self._observer.daemon = True
+            self._observer.start()
+        else:
+            self._observer.unschedule_all()
+        
+        self._observer.schedule(_ConfigFileEventHandler(self), str(watch_dir), recursive=False)
+        self._watched_dir = watch_dir
+        # Changes made before the watcher started are still reported
+        self._config_dirty = self._config_file_path.stat().st_mtime != self._last_modified
+        logger.info(f"Watching configuration file: {self._config_file_path}")
+        return True
+    
+    def stop_watching(self) -> None:
+        """Stop the file watcher and return to mtime-based change checks."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+            self._watched_dir = None
+    
+    def _on_file_event(self, event) -> None:
+        """Mark the configuration dirty if an event changed the config file's contents."""
+        config_path = self._config_file_path
+        if not config_path:
+            return
+        
+        target = str(config_path.resolve())
+        if target not in (event.src_path, getattr(event, "dest_path", None)):
+            return
+        
+        # Our own saves update _last_modified, so they are not reported as changes
+        try:
+            changed = config_path.stat().st_mtime != self._last_modified
+        except OSError:
+            changed = True
+        if changed:
+            self._config_dirty = True
+            if self._on_change:
+                self._on_change()
+    
     def save_config(self, config: UnrealMCPConfig, file_path: Optional[Union[str, Path]] = None) -> None:
         """
         Save configuration to file.
@@ -411,7 +557,10 @@ class ConfigManager:
                 if suffix in ['.yaml', '.yml']:
                     yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
                 elif suffix == '.json':
-                    json.dump(config_dict, f, indent=2, sort_keys=False)
+                    if orjson:
+                        f.write(orjson.dumps(config_dict, option=orjson.OPT_INDENT_2).decode('utf-8'))
+                    else:
+                        json.dump(config_dict, f, indent=2, sort_keys=False)
                 elif suffix == '.toml':
                     try:
                         import tomli_w
@@ -422,6 +571,9 @@ class ConfigManager:
             logger.info(f"Configuration saved to: {save_path}")
             self._config_file_path = save_path
             self._last_modified = save_path.stat().st_mtime
+            self._config_dirty = False
+            self._config_dict = None
+            self._config_checksum = None
             
         except Exception as e:
             logger.error(f"Error saving configuration to {save_path}: {e}")
@@ -464,6 +616,21 @@ class ConfigManager:
         config = self.get_config()
         return config.tools.get(tool_name, ToolConfig())
     
+    def get_tool_config_dict(self, tool_name: str) -> Dict[str, Any]:
+        """
+        Get configuration for a specific tool as a JSON-ready dictionary.
+        
+        Args:
+            tool_name: Name of the tool
+            
+        Returns:
+            Serialized tool configuration (shared for configured tools, must not be modified)
+        """
+        tool_config = self.get_config_dict()["tools"].get(tool_name)
+        if tool_config is None:
+            return ToolConfig().model_dump(mode="json")
+        return tool_config
+    
     def update_tool_config(self, tool_name: str, tool_config: ToolConfig) -> None:
         """
         Update configuration for a specific tool.
@@ -475,6 +642,8 @@ class ConfigManager:
         config = self.get_config()
         config.tools[tool_name] = tool_config
         self._config = config
+        self._config_dict = None
+        self._config_checksum = None
     
     def validate_config(self, config: UnrealMCPConfig) -> List[str]:
         """
@@ -6,52 +6,198 @@ Includes material creation, parameter management, texture assignment, and materi
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+import posixpath
+import threading
+from urllib.parse import unquote
+from typing import Dict, Any, List, Literal, Optional, Tuple, get_args
 from mcp.server.fastmcp import FastMCP, Context
+from mcp.server.fastmcp.exceptions import ToolError
+from pydantic import BaseModel, Field
 
 # Get logger
 logger = logging.getLogger("UnrealMCP")
 
+# Assets modified by parameter writes but not yet saved; flushed by flush_material_saves
+_dirty_assets: set[str] = set()
+_dirty_lock = threading.Lock()
+
+def _mark_dirty(asset_path: str) -> None:
+    """Record an asset as modified so a later flush saves it once."""
+    with _dirty_lock:
+        _dirty_assets.add(asset_path)
+
+def _get_conn():
+    """Return the shared Unreal connection, raising ToolError if it is unavailable."""
+    from unreal_mcp_server import get_unreal_connection
+    
+    unreal = get_unreal_connection()
+    if not unreal:
+        logger.error("Failed to connect to Unreal Engine")
+        raise ToolError("Failed to connect to Unreal Engine")
+    return unreal
+
+# Per-thread LinearColor reused across vector writes; engine setters copy structs by value
+_linear_color_scratch = threading.local()
+
+def _to_linear_color(value, unreal):
+    """Fill the scratch LinearColor from a 3-4 element sequence, defaulting alpha to 1.0."""
+    color = getattr(_linear_color_scratch, "color", None)
+    if color is None:
+        color = _linear_color_scratch.color = unreal.LinearColor(0.0, 0.0, 0.0, 1.0)
+    color.r = float(value[0])
+    color.g = float(value[1])
+    color.b = float(value[2])
+    color.a = float(value[3]) if len(value) > 3 else 1.0
+    return color
+
+def _set_scalar_parameter(unreal, material_asset, parameter_name: str, parameter_value: Any) -> None:
+    material_asset.set_scalar_parameter_value(parameter_name, float(parameter_value))
+
+def _set_vector_parameter(unreal, material_asset, parameter_name: str, parameter_value: Any) -> None:
+    if not (isinstance(parameter_value, (list, tuple)) and len(parameter_value) >= 3):
+        raise ToolError("Vector parameter value must be a list/tuple with 3-4 values")
+    material_asset.set_vector_parameter_value(parameter_name, _to_linear_color(parameter_value, unreal))
+
+def _set_texture_parameter(unreal, material_asset, parameter_name: str, parameter_value: Any) -> None:
+    if not isinstance(parameter_value, str):
+        raise ToolError("Texture parameter value must be a string path")
+    texture_asset = unreal.EditorAssetLibrary.load_asset(parameter_value)
+    if not texture_asset:
+        raise ToolError(f"Texture not found: {parameter_value}")
+    material_asset.set_texture_parameter_value(parameter_name, texture_asset)
+
+def _set_static_switch_parameter(unreal, material_asset, parameter_name: str, parameter_value: Any) -> None:
+    material_asset.set_static_switch_parameter_value(parameter_name, bool(parameter_value))
+
+# Material instance setters keyed by parameter type; a dict lookup replaces the if/elif chain
+_PARAMETER_SETTERS = {
+    "Scalar": _set_scalar_parameter,
+    "Vector": _set_vector_parameter,
+    "Texture": _set_texture_parameter,
+    "StaticSwitch": _set_static_switch_parameter,
+}
+
+def _parameter_names(params) -> List[str]:
+    """Convert engine Name objects to strings in one pass, avoiding a get_name() call per element."""
+    return list(map(str, params))
+
+# Supported enum names; as Literal types FastMCP publishes them as JSON schema enums
+MaterialDomain = Literal["Surface", "PostProcess", "LightFunction", "Volume", "UI", "DeferredDecal"]
+BlendMode = Literal["Opaque", "Masked", "Translucent", "Additive", "Modulate", "AlphaComposite"]
+ShadingModel = Literal["DefaultLit", "Unlit", "Subsurface", "PreintegratedSkin", "ClearCoat",
+                       "SubsurfaceProfile", "TwoSidedFoliage"]
+MaterialParameterType = Literal["Scalar", "Vector", "Texture", "StaticSwitch"]
+CollectionParameterType = Literal["Scalar", "Vector", "Texture"]
+
+MATERIAL_DOMAINS = get_args(MaterialDomain)
+BLEND_MODES = get_args(BlendMode)
+SHADING_MODELS = get_args(ShadingModel)
+
+class MaterialCreated(BaseModel):
+    """A newly created material asset."""
+    name: str
+    path: str
+    material_domain: str
+    blend_mode: str
+    shading_model: str
+
+class MaterialInstanceCreated(BaseModel):
+    """A newly created material instance."""
+    name: str
+    path: str
+    parent_material: str
+
+class ParameterSet(BaseModel):
+    """A parameter written to a material instance or parameter collection."""
+    name: str
+    type: str
+    value: Any
+    saved: bool
+
+class AssignResult(BaseModel):
+    """A material assigned to a static mesh slot."""
+    mesh: str
+    material: str
+    slot: int
+
+class CollectionCreated(BaseModel):
+    """A newly created material parameter collection."""
+    name: str
+    path: str
+
+class MaterialInfo(BaseModel):
+    """Material properties; parent and parameter names are only set for material instances."""
+    name: str
+    path: str
+    type: str
+    blend_mode: str
+    shading_model: str
+    material_domain: str
+    parent_material: Optional[str] = None
+    scalar_parameters: Optional[List[str]] = None
+    vector_parameters: Optional[List[str]] = None
+    texture_parameters: Optional[List[str]] = None
+
+class TextureAssignment(BaseModel):
+    """A texture intended for a material input slot."""
+    slot: str
+    texture: str
+
+class TexturedMaterialCreated(BaseModel):
+    """A material created from textures, with the assignments still to be wired."""
+    material: MaterialCreated
+    texture_assignments: List[TextureAssignment]
+    note: str
+
+class MaterialDuplicated(BaseModel):
+    """A material copied from a source asset."""
+    name: str
+    path: str
+    source_material: str
+
+# Enum values resolved once on first use instead of by reflection on every call
+_material_enums: Optional[Dict[str, Dict[str, Any]]] = None
+
+def _get_material_enums(unreal) -> Dict[str, Dict[str, Any]]:
+    """Return name -> enum value tables for material domain, blend mode and shading model."""
+    global _material_enums
+    if _material_enums is None:
+        _material_enums = {
+            "material domain": {name: getattr(unreal.MaterialDomain, name) for name in MATERIAL_DOMAINS},
+            "blend mode": {name: getattr(unreal.BlendMode, name) for name in BLEND_MODES},
+            "shading model": {name: getattr(unreal.MaterialShadingModel, name) for name in SHADING_MODELS},
+        }
+    return _material_enums
+
 def register_material_tools(mcp: FastMCP):
     """Register material tools with the MCP server."""
     
-    @mcp.tool()
-    def create_material(
-        ctx: Context,
+    def _create_material_sync(
         material_name: str,
-        material_path: str = "/Game/Materials",
-        parent_material: str = "/Engine/BasicShapes/BasicShapeMaterial",
-        material_domain: str = "Surface",
-        blend_mode: str = "Opaque",
-        shading_model: str = "DefaultLit"
-    ) -> Dict[str, Any]:
-        """
-        Create a new material asset.
-        
-        Args:
-            material_name: Name of the material to create
-            material_path: Path where the material will be created
-            parent_material: Parent material class to inherit from
-            material_domain: Material domain (Surface, PostProcess, LightFunction, etc.)
-            blend_mode: Blend mode (Opaque, Masked, Translucent, Additive, etc.)
-            shading_model: Shading model (DefaultLit, Unlit, Subsurface, etc.)
-            
-        Returns:
-            Dict containing the created material's properties and success status
-        """
-        from unreal_mcp_server import get_unreal_connection
-        
+        material_path: str,
+        material_domain: MaterialDomain,
+        blend_mode: BlendMode,
+        shading_model: ShadingModel
+    ) -> Tuple[MaterialCreated, Any]:
+        """Create a material asset, returning (result, asset handle); raises ToolError on failure."""
         try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
+            unreal = _get_conn()
+            
+            # Resolve enum values from the precomputed tables
+            enums = _get_material_enums(unreal)
+            resolved = {}
+            for kind, value in (("material domain", material_domain),
+                                ("blend mode", blend_mode),
+                                ("shading model", shading_model)):
+                if value not in enums[kind]:
+                    raise ToolError(f"Unknown {kind}: {value}")
+                resolved[kind] = enums[kind][value]
             
             # Create the material
             material_factory = unreal.MaterialFactoryNew()
-            material_factory.set_editor_property("material_domain", getattr(unreal.MaterialDomain, material_domain))
-            material_factory.set_editor_property("blend_mode", getattr(unreal.BlendMode, blend_mode))
-            material_factory.set_editor_property("shading_model", getattr(unreal.MaterialShadingModel, shading_model))
+            material_factory.set_editor_property("material_domain", resolved["material domain"])
+            material_factory.set_editor_property("blend_mode", resolved["blend mode"])
+            material_factory.set_editor_property("shading_model", resolved["shading model"])
             
             # Create the material asset
             material_asset = unreal.AssetToolsHelpers.get_asset_tools().create_asset(
@@ -62,58 +208,58 @@ def register_material_tools(mcp: FastMCP):
             )
             
             if not material_asset:
-                return {"success": False, "message": f"Failed to create material {material_name}"}
-            
-            # Get material properties
-            material_properties = {
-                "name": material_asset.get_name(),
-                "path": material_asset.get_path_name(),
-                "material_domain": material_domain,
-                "blend_mode": blend_mode,
-                "shading_model": shading_model
-            }
+                raise ToolError(f"Failed to create material {material_name}")
             
             logger.info(f"Created material: {material_name} at {material_path}")
-            return {
-                "success": True,
-                "message": f"Material {material_name} created successfully",
-                "material": material_properties
-            }
-            
+            return MaterialCreated(
+                name=material_asset.get_name(),
+                path=material_asset.get_path_name(),
+                material_domain=material_domain,
+                blend_mode=blend_mode,
+                shading_model=shading_model
+            ), material_asset
+            
+        except ToolError:
+            raise
         except Exception as e:
             logger.error(f"Error creating material: {str(e)}")
-            return {"success": False, "message": f"Error creating material: {str(e)}"}
+            raise ToolError(f"Error creating material: {str(e)}") from e
+
+    @mcp.tool()
+    def create_material(
+        ctx: Context,
+        material_name: str = Field(description="Name of the material to create"),
+        material_path: str = Field(default="/Game/Materials", description="Path where the material will be created"),
+        parent_material: str = Field(default="/Engine/BasicShapes/BasicShapeMaterial", description="Parent material class to inherit from"),
+        material_domain: MaterialDomain = Field(default="Surface", description="Material domain"),
+        blend_mode: BlendMode = Field(default="Opaque", description="Blend mode"),
+        shading_model: ShadingModel = Field(default="DefaultLit", description="Shading model")
+    ) -> MaterialCreated:
+        """Create a new material asset."""
+        material, _ = _create_material_sync(
+            material_name,
+            material_path,
+            material_domain,
+            blend_mode,
+            shading_model
+        )
+        return material
 
     @mcp.tool()
     def create_material_instance(
         ctx: Context,
-        instance_name: str,
-        parent_material: str,
-        instance_path: str = "/Game/Materials/Instances"
-    ) -> Dict[str, Any]:
-        """
-        Create a new material instance.
-        
-        Args:
-            instance_name: Name of the material instance to create
-            parent_material: Path to the parent material
-            instance_path: Path where the instance will be created
-            
-        Returns:
-            Dict containing the created material instance properties and success status
-        """
-        from unreal_mcp_server import get_unreal_connection
-        
+        instance_name: str = Field(description="Name of the material instance to create"),
+        parent_material: str = Field(description="Path to the parent material"),
+        instance_path: str = Field(default="/Game/Materials/Instances", description="Path where the instance will be created")
+    ) -> MaterialInstanceCreated:
+        """Create a new material instance."""
         try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
+            unreal = _get_conn()
             
             # Load the parent material
             parent_material_asset = unreal.EditorAssetLibrary.load_asset(parent_material)
             if not parent_material_asset:
-                return {"success": False, "message": f"Parent material not found: {parent_material}"}
+                raise ToolError(f"Parent material not found: {parent_material}")
             
             # Create material instance factory
             instance_factory = unreal.MaterialInstanceConstantFactoryNew()
@@ -128,160 +274,90 @@ def register_material_tools(mcp: FastMCP):
             )
             
             if not instance_asset:
-                return {"success": False, "message": f"Failed to create material instance {instance_name}"}
-            
-            # Get instance properties
-            instance_properties = {
-                "name": instance_asset.get_name(),
-                "path": instance_asset.get_path_name(),
-                "parent_material": parent_material
-            }
+                raise ToolError(f"Failed to create material instance {instance_name}")
             
             logger.info(f"Created material instance: {instance_name} with parent {parent_material}")
-            return {
-                "success": True,
-                "message": f"Material instance {instance_name} created successfully",
-                "material_instance": instance_properties
-            }
+            return MaterialInstanceCreated(
+                name=instance_asset.get_name(),
+                path=instance_asset.get_path_name(),
+                parent_material=parent_material
+            )
             
+        except ToolError:
+            raise
         except Exception as e:
             logger.error(f"Error creating material instance: {str(e)}")
-            return {"success": False, "message": f"Error creating material instance: {str(e)}"}
+            raise ToolError(f"Error creating material instance: {str(e)}") from e
 
     @mcp.tool()
     def set_material_parameter(
         ctx: Context,
-        material_path: str,
-        parameter_name: str,
-        parameter_value: Any,
-        parameter_type: str = "Scalar"
-    ) -> Dict[str, Any]:
-        """
-        Set a parameter value on a material or material instance.
-        
-        Args:
-            material_path: Path to the material or material instance
-            parameter_name: Name of the parameter to set
-            parameter_value: Value to set the parameter to
-            parameter_type: Type of parameter (Scalar, Vector, Texture, StaticSwitch)
-            
-        Returns:
-            Response indicating success or failure
-        """
-        from unreal_mcp_server import get_unreal_connection
-        
+        material_path: str = Field(description="Path to the material or material instance"),
+        parameter_name: str = Field(description="Name of the parameter to set"),
+        parameter_value: Any = Field(description="Value to set the parameter to"),
+        parameter_type: MaterialParameterType = Field(default="Scalar", description="Type of parameter"),
+        auto_save: bool = Field(default=False, description="Save the asset immediately instead of deferring to flush_material_saves")
+    ) -> ParameterSet:
+        """Set a parameter value on a material or material instance."""
         try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
+            unreal = _get_conn()
             
             # Load the material asset
             material_asset = unreal.EditorAssetLibrary.load_asset(material_path)
             if not material_asset:
-                return {"success": False, "message": f"Material not found: {material_path}"}
+                raise ToolError(f"Material not found: {material_path}")
             
-            # Set parameter based on type
-            if parameter_type == "Scalar":
-                if isinstance(material_asset, unreal.MaterialInstanceConstant):
-                    material_asset.set_scalar_parameter_value(parameter_name, float(parameter_value))
-                else:
-                    logger.warning("Scalar parameters can only be set on material instances")
-                    return {"success": False, "message": "Scalar parameters can only be set on material instances"}
-            
-            elif parameter_type == "Vector":
-                if isinstance(material_asset, unreal.MaterialInstanceConstant):
-                    if isinstance(parameter_value, (list, tuple)) and len(parameter_value) >= 3:
-                        vector_value = unreal.LinearColor(
-                            float(parameter_value[0]),
-                            float(parameter_value[1]),
-                            float(parameter_value[2]),
-                            float(parameter_value[3]) if len(parameter_value) > 3 else 1.0
-                        )
-                        material_asset.set_vector_parameter_value(parameter_name, vector_value)
-                    else:
-                        return {"success": False, "message": "Vector parameter value must be a list/tuple with 3-4 values"}
-                else:
-                    logger.warning("Vector parameters can only be set on material instances")
-                    return {"success": False, "message": "Vector parameters can only be set on material instances"}
-            
-            elif parameter_type == "Texture":
-                if isinstance(material_asset, unreal.MaterialInstanceConstant):
-                    if isinstance(parameter_value, str):
-                        texture_asset = unreal.EditorAssetLibrary.load_asset(parameter_value)
-                        if texture_asset:
-                            material_asset.set_texture_parameter_value(parameter_name, texture_asset)
-                        else:
-                            return {"success": False, "message": f"Texture not found: {parameter_value}"}
-                    else:
-                        return {"success": False, "message": "Texture parameter value must be a string path"}
-                else:
-                    logger.warning("Texture parameters can only be set on material instances")
-                    return {"success": False, "message": "Texture parameters can only be set on material instances"}
-            
-            elif parameter_type == "StaticSwitch":
-                if isinstance(material_asset, unreal.MaterialInstanceConstant):
-                    material_asset.set_static_switch_parameter_value(parameter_name, bool(parameter_value))
-                else:
-                    logger.warning("Static switch parameters can only be set on material instances")
-                    return {"success": False, "message": "Static switch parameters can only be set on material instances"}
+            # Parameters can only be set on material instances
+            if not isinstance(material_asset, unreal.MaterialInstanceConstant):
+                logger.warning(f"{parameter_type} parameters can only be set on material instances")
+                raise ToolError(f"{parameter_type} parameters can only be set on material instances")
             
+            # Set parameter based on type
+            setter = _PARAMETER_SETTERS.get(parameter_type)
+            if setter is None:
+                raise ToolError(f"Unsupported parameter type: {parameter_type}")
+            setter(unreal, material_asset, parameter_name, parameter_value)
+            
+            # Save now, or defer so repeated edits cost a single save
+            if auto_save:
+                unreal.EditorAssetLibrary.save_asset(material_path)
             else:
-                return {"success": False, "message": f"Unsupported parameter type: {parameter_type}"}
-            
-            # Save the material
-            unreal.EditorAssetLibrary.save_asset(material_path)
+                _mark_dirty(material_path)
             
             logger.info(f"Set {parameter_type} parameter '{parameter_name}' to {parameter_value} on {material_path}")
-            return {
-                "success": True,
-                "message": f"Parameter '{parameter_name}' set successfully",
-                "parameter": {
-                    "name": parameter_name,
-                    "value": parameter_value,
-                    "type": parameter_type
-                }
-            }
+            return ParameterSet(
+                name=parameter_name,
+                type=parameter_type,
+                value=parameter_value,
+                saved=auto_save
+            )
             
+        except ToolError:
+            raise
         except Exception as e:
             logger.error(f"Error setting material parameter: {str(e)}")
-            return {"success": False, "message": f"Error setting material parameter: {str(e)}"}
+            raise ToolError(f"Error setting material parameter: {str(e)}") from e
 
     @mcp.tool()
     def assign_material_to_mesh(
         ctx: Context,
-        mesh_path: str,
-        material_path: str,
-        material_slot: int = 0
-    ) -> Dict[str, Any]:
-        """
-        Assign a material to a static mesh.
-        
-        Args:
-            mesh_path: Path to the static mesh asset
-            material_path: Path to the material to assign
-            material_slot: Material slot index to assign to
-            
-        Returns:
-            Response indicating success or failure
-        """
-        from unreal_mcp_server import get_unreal_connection
-        
+        mesh_path: str = Field(description="Path to the static mesh asset"),
+        material_path: str = Field(description="Path to the material to assign"),
+        material_slot: int = Field(default=0, description="Material slot index to assign to")
+    ) -> AssignResult:
+        """Assign a material to a static mesh."""
         try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
+            unreal = _get_conn()
             
             # Load the mesh asset
             mesh_asset = unreal.EditorAssetLibrary.load_asset(mesh_path)
             if not mesh_asset:
-                return {"success": False, "message": f"Static mesh not found: {mesh_path}"}
+                raise ToolError(f"Static mesh not found: {mesh_path}")
             
             # Load the material asset
             material_asset = unreal.EditorAssetLibrary.load_asset(material_path)
             if not material_asset:
-                return {"success": False, "message": f"Material not found: {material_path}"}
+                raise ToolError(f"Material not found: {material_path}")
             
             # Assign material to the mesh
             mesh_asset.set_material(material_slot, material_asset)
@@ -290,43 +366,27 @@ def register_material_tools(mcp: FastMCP):
             unreal.EditorAssetLibrary.save_asset(mesh_path)
             
             logger.info(f"Assigned material {material_path} to mesh {mesh_path} at slot {material_slot}")
-            return {
-                "success": True,
-                "message": f"Material assigned to mesh successfully",
-                "assignment": {
-                    "mesh": mesh_path,
-                    "material": material_path,
-                    "slot": material_slot
-                }
-            }
+            return AssignResult(
+                mesh=mesh_path,
+                material=material_path,
+                slot=material_slot
+            )
             
+        except ToolError:
+            raise
         except Exception as e:
             logger.error(f"Error assigning material to mesh: {str(e)}")
-            return {"success": False, "message": f"Error assigning material to mesh: {str(e)}"}
+            raise ToolError(f"Error assigning material to mesh: {str(e)}") from e
 
     @mcp.tool()
     def create_material_parameter_collection(
         ctx: Context,
-        collection_name: str,
-        collection_path: str = "/Game/Materials/ParameterCollections"
-    ) -> Dict[str, Any]:
-        """
-        Create a new material parameter collection.
-        
-        Args:
-            collection_name: Name of the parameter collection to create
-            collection_path: Path where the collection will be created
-            
-        Returns:
-            Dict containing the created collection properties and success status
-        """
-        from unreal_mcp_server import get_unreal_connection
-        
+        collection_name: str = Field(description="Name of the parameter collection to create"),
+        collection_path: str = Field(default="/Game/Materials/ParameterCollections", description="Path where the collection will be created")
+    ) -> CollectionCreated:
+        """Create a new material parameter collection."""
         try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
+            unreal = _get_conn()
             
             # Create the parameter collection
             collection_factory = unreal.MaterialParameterCollectionFactoryNew()
@@ -338,57 +398,37 @@ def register_material_tools(mcp: FastMCP):
             )
             
             if not collection_asset:
-                return {"success": False, "message": f"Failed to create parameter collection {collection_name}"}
-            
-            # Get collection properties
-            collection_properties = {
-                "name": collection_asset.get_name(),
-                "path": collection_asset.get_path_name()
-            }
+                raise ToolError(f"Failed to create parameter collection {collection_name}")
             
             logger.info(f"Created material parameter collection: {collection_name} at {collection_path}")
-            return {
-                "success": True,
-                "message": f"Parameter collection {collection_name} created successfully",
-                "collection": collection_properties
-            }
+            return CollectionCreated(
+                name=collection_asset.get_name(),
+                path=collection_asset.get_path_name()
+            )
             
+        except ToolError:
+            raise
         except Exception as e:
             logger.error(f"Error creating parameter collection: {str(e)}")
-            return {"success": False, "message": f"Error creating parameter collection: {str(e)}"}
+            raise ToolError(f"Error creating parameter collection: {str(e)}") from e
 
     @mcp.tool()
     def add_parameter_to_collection(
         ctx: Context,
-        collection_path: str,
-        parameter_name: str,
-        parameter_type: str = "Scalar",
-        default_value: Any = 0.0
-    ) -> Dict[str, Any]:
-        """
-        Add a parameter to a material parameter collection.
-        
-        Args:
-            collection_path: Path to the parameter collection
-            parameter_name: Name of the parameter to add
-            parameter_type: Type of parameter (Scalar, Vector, Texture)
-            default_value: Default value for the parameter
-            
-        Returns:
-            Response indicating success or failure
-        """
-        from unreal_mcp_server import get_unreal_connection
-        
+        collection_path: str = Field(description="Path to the parameter collection"),
+        parameter_name: str = Field(description="Name of the parameter to add"),
+        parameter_type: CollectionParameterType = Field(default="Scalar", description="Type of parameter"),
+        default_value: Any = Field(default=0.0, description="Default value for the parameter"),
+        auto_save: bool = Field(default=False, description="Save the asset immediately instead of deferring to flush_material_saves")
+    ) -> ParameterSet:
+        """Add a parameter to a material parameter collection."""
         try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
+            unreal = _get_conn()
             
             # Load the collection
             collection_asset = unreal.EditorAssetLibrary.load_asset(collection_path)
             if not collection_asset:
-                return {"success": False, "message": f"Parameter collection not found: {collection_path}"}
+                raise ToolError(f"Parameter collection not found: {collection_path}")
             
             # Create parameter info
             param_info = unreal.MaterialParameterInfo()
@@ -399,71 +439,50 @@ def register_material_tools(mcp: FastMCP):
                 collection_asset.add_scalar_parameter(param_info, float(default_value))
             elif parameter_type == "Vector":
                 if isinstance(default_value, (list, tuple)) and len(default_value) >= 3:
-                    vector_value = unreal.LinearColor(
-                        float(default_value[0]),
-                        float(default_value[1]),
-                        float(default_value[2]),
-                        float(default_value[3]) if len(default_value) > 3 else 1.0
-                    )
-                    collection_asset.add_vector_parameter(param_info, vector_value)
+                    collection_asset.add_vector_parameter(param_info, _to_linear_color(default_value, unreal))
                 else:
-                    return {"success": False, "message": "Vector default value must be a list/tuple with 3-4 values"}
+                    raise ToolError("Vector default value must be a list/tuple with 3-4 values")
             elif parameter_type == "Texture":
                 if isinstance(default_value, str):
                     texture_asset = unreal.EditorAssetLibrary.load_asset(default_value)
                     if texture_asset:
                         collection_asset.add_texture_parameter(param_info, texture_asset)
                     else:
-                        return {"success": False, "message": f"Default texture not found: {default_value}"}
+                        raise ToolError(f"Default texture not found: {default_value}")
                 else:
-                    return {"success": False, "message": "Texture default value must be a string path"}
+                    raise ToolError("Texture default value must be a string path")
             else:
-                return {"success": False, "message": f"Unsupported parameter type: {parameter_type}"}
+                raise ToolError(f"Unsupported parameter type: {parameter_type}")
             
-            # Save the collection
-            unreal.EditorAssetLibrary.save_asset(collection_path)
+            # Save now, or defer so repeated edits cost a single save
+            if auto_save:
+                unreal.EditorAssetLibrary.save_asset(collection_path)
+            else:
+                _mark_dirty(collection_path)
             
             logger.info(f"Added {parameter_type} parameter '{parameter_name}' to collection {collection_path}")
-            return {
-                "success": True,
-                "message": f"Parameter '{parameter_name}' added to collection successfully",
-                "parameter": {
-                    "name": parameter_name,
-                    "type": parameter_type,
-                    "default_value": default_value
-                }
-            }
+            return ParameterSet(
+                name=parameter_name,
+                type=parameter_type,
+                value=default_value,
+                saved=auto_save
+            )
             
+        except ToolError:
+            raise
         except Exception as e:
             logger.error(f"Error adding parameter to collection: {str(e)}")
-            return {"success": False, "message": f"Error adding parameter to collection: {str(e)}"}
+            raise ToolError(f"Error adding parameter to collection: {str(e)}") from e
 
-    @mcp.tool()
-    def get_material_info(
-        ctx: Context,
-        material_path: str
-    ) -> Dict[str, Any]:
-        """
-        Get detailed information about a material or material instance.
-        
-        Args:
-            material_path: Path to the material asset
-            
-        Returns:
-            Dict containing material information and properties
-        """
-        from unreal_mcp_server import get_unreal_connection
-        
+    def _read_material_info(material_path: str) -> MaterialInfo:
+        """Load a material and describe it; shared by the get_material_info tool and material:// resource."""
         try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
+            unreal = _get_conn()
             
             # Load the material asset
             material_asset = unreal.EditorAssetLibrary.load_asset(material_path)
             if not material_asset:
-                return {"success": False, "message": f"Material not found: {material_path}"}
+                raise ToolError(f"Material not found: {material_path}")
             
             # Get basic material info
             material_info = {
@@ -481,66 +500,68 @@ def register_material_tools(mcp: FastMCP):
                 if parent_material:
                     material_info["parent_material"] = parent_material.get_path_name()
                 
-                # Get scalar parameters
-                scalar_params = material_asset.get_scalar_parameter_names()
-                material_info["scalar_parameters"] = [param.get_name() for param in scalar_params]
-                
-                # Get vector parameters
-                vector_params = material_asset.get_vector_parameter_names()
-                material_info["vector_parameters"] = [param.get_name() for param in vector_params]
-                
-                # Get texture parameters
-                texture_params = material_asset.get_texture_parameter_names()
-                material_info["texture_parameters"] = [param.get_name() for param in texture_params]
+                # Get scalar, vector and texture parameter names
+                material_info["scalar_parameters"] = _parameter_names(material_asset.get_scalar_parameter_names())
+                material_info["vector_parameters"] = _parameter_names(material_asset.get_vector_parameter_names())
+                material_info["texture_parameters"] = _parameter_names(material_asset.get_texture_parameter_names())
             
             logger.info(f"Retrieved material info for {material_path}")
-            return {
-                "success": True,
-                "message": f"Material info retrieved successfully",
-                "material_info": material_info
-            }
+            return MaterialInfo(**material_info)
             
+        except ToolError:
+            raise
         except Exception as e:
             logger.error(f"Error getting material info: {str(e)}")
-            return {"success": False, "message": f"Error getting material info: {str(e)}"}
+            raise ToolError(f"Error getting material info: {str(e)}") from e
+
+    @mcp.tool()
+    def get_material_info(
+        ctx: Context,
+        material_path: str = Field(description="Path to the material asset")
+    ) -> MaterialInfo:
+        """Get detailed information about a material or material instance."""
+        return _read_material_info(material_path)
+
+    @mcp.resource("material://{path}")
+    def material_resource(path: str) -> MaterialInfo:
+        """Material information for a URL-encoded content path, e.g. material://%2FGame%2FMaterials%2FM_Rock."""
+        return _read_material_info(unquote(path))
+
+    @mcp.resource("material-list://")
+    def material_list_resource() -> List[str]:
+        """Asset paths of all materials under /Game/Materials."""
+        try:
+            unreal = _get_conn()
+            
+            material_paths = unreal.EditorAssetLibrary.list_assets(
+                "/Game/Materials",
+                recursive=True,
+                include_folder=False
+            )
+            
+            return list(material_paths)
+            
+        except ToolError:
+            raise
+        except Exception as e:
+            logger.error(f"Error listing materials: {str(e)}")
+            raise ToolError(f"Error listing materials: {str(e)}") from e
 
     @mcp.tool()
     def create_material_from_textures(
         ctx: Context,
-        material_name: str,
-        base_color_texture: str = "",
-        normal_texture: str = "",
-        roughness_texture: str = "",
-        metallic_texture: str = "",
-        emissive_texture: str = "",
-        material_path: str = "/Game/Materials"
-    ) -> Dict[str, Any]:
-        """
-        Create a material with automatic texture assignments.
-        
-        Args:
-            material_name: Name of the material to create
-            base_color_texture: Path to base color texture
-            normal_texture: Path to normal map texture
-            roughness_texture: Path to roughness texture
-            metallic_texture: Path to metallic texture
-            emissive_texture: Path to emissive texture
-            material_path: Path where the material will be created
-            
-        Returns:
-            Dict containing the created material properties and success status
-        """
-        from unreal_mcp_server import get_unreal_connection
-        
+        material_name: str = Field(description="Name of the material to create"),
+        base_color_texture: str = Field(default="", description="Path to base color texture"),
+        normal_texture: str = Field(default="", description="Path to normal map texture"),
+        roughness_texture: str = Field(default="", description="Path to roughness texture"),
+        metallic_texture: str = Field(default="", description="Path to metallic texture"),
+        emissive_texture: str = Field(default="", description="Path to emissive texture"),
+        material_path: str = Field(default="/Game/Materials", description="Path where the material will be created")
+    ) -> TexturedMaterialCreated:
+        """Create a material with automatic texture assignments."""
         try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            # Create the material first
-            material_result = create_material(
-                ctx,
+            # Create the material first; the returned handle avoids reloading the asset
+            material_result, material_asset = _create_material_sync(
                 material_name,
                 material_path,
                 material_domain="Surface",
@@ -548,78 +569,52 @@ def register_material_tools(mcp: FastMCP):
                 shading_model="DefaultLit"
             )
             
-            if not material_result.get("success"):
-                return material_result
-            
-            # Load the created material
-            material_asset = unreal.EditorAssetLibrary.load_asset(f"{material_path}/{material_name}")
-            if not material_asset:
-                return {"success": False, "message": f"Failed to load created material: {material_name}"}
-            
             # Open the material editor to add nodes (this would require more complex implementation)
             # For now, we'll return success with the material created
-            texture_assignments = []
-            
-            if base_color_texture:
-                texture_assignments.append({"slot": "Base Color", "texture": base_color_texture})
-            if normal_texture:
-                texture_assignments.append({"slot": "Normal", "texture": normal_texture})
-            if roughness_texture:
-                texture_assignments.append({"slot": "Roughness", "texture": roughness_texture})
-            if metallic_texture:
-                texture_assignments.append({"slot": "Metallic", "texture": metallic_texture})
-            if emissive_texture:
-                texture_assignments.append({"slot": "Emissive", "texture": emissive_texture})
+            texture_assignments = [
+                TextureAssignment(slot=slot, texture=texture)
+                for slot, texture in (
+                    ("Base Color", base_color_texture),
+                    ("Normal", normal_texture),
+                    ("Roughness", roughness_texture),
+                    ("Metallic", metallic_texture),
+                    ("Emissive", emissive_texture)
+                )
+                if texture
+            ]
             
             logger.info(f"Created material {material_name} with texture assignments")
-            return {
-                "success": True,
-                "message": f"Material {material_name} created successfully",
-                "material": material_result.get("material"),
-                "texture_assignments": texture_assignments,
-                "note": "Material nodes need to be connected manually in the Material Editor"
-            }
+            return TexturedMaterialCreated(
+                material=material_result,
+                texture_assignments=texture_assignments,
+                note="Material nodes need to be connected manually in the Material Editor"
+            )
             
+        except ToolError:
+            raise
         except Exception as e:
             logger.error(f"Error creating material from textures: {str(e)}")
-            return {"success": False, "message": f"Error creating material from textures: {str(e)}"}
+            raise ToolError(f"Error creating material from textures: {str(e)}") from e
 
     @mcp.tool()
     def duplicate_material(
         ctx: Context,
-        source_material_path: str,
-        new_material_name: str,
-        new_material_path: str = None
-    ) -> Dict[str, Any]:
-        """
-        Duplicate an existing material.
-        
-        Args:
-            source_material_path: Path to the source material to duplicate
-            new_material_name: Name for the new material
-            new_material_path: Path for the new material (defaults to same directory as source)
-            
-        Returns:
-            Dict containing the duplicated material properties and success status
-        """
-        from unreal_mcp_server import get_unreal_connection
-        
+        source_material_path: str = Field(description="Path to the source material to duplicate"),
+        new_material_name: str = Field(description="Name for the new material"),
+        new_material_path: Optional[str] = Field(default=None, description="Path for the new material (defaults to same directory as source)")
+    ) -> MaterialDuplicated:
+        """Duplicate an existing material."""
         try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
+            unreal = _get_conn()
             
             # Load the source material
             source_material = unreal.EditorAssetLibrary.load_asset(source_material_path)
             if not source_material:
-                return {"success": False, "message": f"Source material not found: {source_material_path}"}
+                raise ToolError(f"Source material not found: {source_material_path}")
             
             # Determine destination path
             if not new_material_path:
-                import os
-                source_dir = os.path.dirname(source_material_path)
-                new_material_path = f"{source_dir}/{new_material_name}"
+                new_material_path = posixpath.join(posixpath.dirname(source_material_path), new_material_name)
             
             # Duplicate the material
             duplicated_material = unreal.EditorAssetLibrary.duplicate_asset(
@@ -628,24 +623,71 @@ def register_material_tools(mcp: FastMCP):
             )
             
             if not duplicated_material:
-                return {"success": False, "message": f"Failed to duplicate material {source_material_path}"}
-            
-            # Get duplicated material properties
-            duplicated_properties = {
-                "name": duplicated_material.get_name(),
-                "path": duplicated_material.get_path_name(),
-                "source_material": source_material_path
-            }
+                raise ToolError(f"Failed to duplicate material {source_material_path}")
             
             logger.info(f"Duplicated material {source_material_path} to {new_material_path}")
+            return MaterialDuplicated(
+                name=duplicated_material.get_name(),
+                path=duplicated_material.get_path_name(),
+                source_material=source_material_path
+            )
+            
+        except ToolError:
+            raise
+        except Exception as e:
+            logger.error(f"Error duplicating material: {str(e)}")
+            raise ToolError(f"Error duplicating material: {str(e)}") from e
+
+    @mcp.tool()
+    def flush_material_saves(ctx: Context) -> Dict[str, Any]:
+        """Save every material and parameter collection modified since the last flush."""
+        try:
+            unreal = _get_conn()
+            
+            # Snapshot and clear under the lock so concurrent writers are not lost
+            with _dirty_lock:
+                pending = sorted(_dirty_assets)
+                _dirty_assets.clear()
+            
+            saved = []
+            failed = []
+            for asset_path in pending:
+                try:
+                    if unreal.EditorAssetLibrary.save_asset(asset_path):
+                        saved.append(asset_path)
+                    else:
+                        failed.append(asset_path)
+                except Exception as e:
+                    logger.error(f"Error saving {asset_path}: {str(e)}")
+                    failed.append(asset_path)
+            
+            # Keep failed assets dirty so the next flush retries them
+            if failed:
+                with _dirty_lock:
+                    _dirty_assets.update(failed)
+            
+            logger.info(f"Flushed material saves: {len(saved)} saved, {len(failed)} failed")
             return {
-                "success": True,
-                "message": f"Material duplicated successfully",
-                "duplicated_material": duplicated_properties
+                "success": not failed,
+                "message": f"Saved {len(saved)} of {len(pending)} modified assets",
+                "saved": saved,
+                "failed": failed
             }
             
+        except ToolError:
+            raise
         except Exception as e:
-            logger.error(f"Error duplicating material: {str(e)}")
-            return {"success": False, "message": f"Error duplicating material: {str(e)}"}
+            logger.error(f"Error flushing material saves: {str(e)}")
+            raise ToolError(f"Error flushing material saves: {str(e)}") from e
+
+    @mcp.tool()
+    def ping(ctx: Context) -> Dict[str, Any]:
+        """Check whether Unreal Engine is reachable."""
+        from unreal_mcp_server import get_unreal_connection
+        
+        return {
+            "success": True,
+            "connected": get_unreal_connection() is not None
+        }
 
     logger.info("Material tools registered successfully")
@@ -5,17 +5,173 @@ This module provides tools for manipulating Blueprint graph nodes and connection
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+import time
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
 from mcp.server.fastmcp import FastMCP, Context
+from tools.command_batcher import NO_RESPONSE_ERROR, get_shared_pool
 
 # Get logger
 logger = logging.getLogger("UnrealMCP")
 
+# Node kinds accepted by add_blueprint_nodes, mapped to the equivalent single-node command
+BATCH_NODE_KINDS = {
+    "event": "add_blueprint_event_node",
+    "input_action": "add_blueprint_input_action_node",
+    "function": "add_blueprint_function_node",
+    "variable_get": "add_blueprint_variable_get_node",
+    "variable_set": "add_blueprint_variable_set_node",
+    "math": "add_blueprint_math_node",
+    "branch": "add_blueprint_branch_node",
+    "self_component_reference": "add_blueprint_get_self_component_reference",
+    "self_reference": "add_blueprint_self_reference",
+    "node": "create_blueprint_node",
+}
+
+# Graph position used when a tool is called without node_position; a tuple so it can be shared
+DEFAULT_NODE_POSITION = (0, 0)
+
+# Seconds a get_available_blueprint_nodes result is served from memory
+NODE_CATALOG_TTL = 300.0
+
+# Maximum node classes kept by the get_blueprint_node_info cache
+NODE_INFO_CACHE_SIZE = 512
+
+# (monotonic timestamp, response) of the last successful node discovery
+_node_catalog_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+# Successful get_blueprint_node_info responses by node class, least recently used first
+_node_info_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+# Node classes already created this session; a new one may extend the catalog
+_created_node_classes: set[str] = set()
+
+# Set once the plugin answers add_blueprint_nodes_batch or add_blueprint_subgraph with "Unknown command"
+_node_batch_unsupported = False
+_subgraph_unsupported = False
+
+def _is_success(response: Optional[Dict[str, Any]]) -> bool:
+    """Whether a normalized Unreal response reports success."""
+    return bool(response) and response.get("status") != "error" and response.get("success") is not False
+
+def _invalidate_node_caches():
+    """Drop the cached node catalog and node class info."""
+    global _node_catalog_cache
+    _node_catalog_cache = None
+    _node_info_cache.clear()
+
+async def _send_node_command(command: str, params: Dict[str, Any], action: str) -> Dict[str, Any]:
+    """Send a node command over a pooled connection, converting failures to error responses."""
+    try:
+        async with get_shared_pool().acquire() as unreal:
+            response = await unreal.send_command(command, params)
+        
+        if not response:
+            logger.error("No response from Unreal Engine")
+            return NO_RESPONSE_ERROR
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s response: %s", command, response)
+        return response
+        
+    except Exception as e:
+        error_msg = f"Error {action}: {e}"
+        logger.error(error_msg)
+        return {"success": False, "message": error_msg}
+
+def _node_id(response: Dict[str, Any]) -> Optional[str]:
+    """Return the node ID reported in a node creation response or its "result"."""
+    payload = response.get("result") if isinstance(response.get("result"), dict) else response
+    return payload.get("node_id")
+
+def _is_unknown_command(response: Dict[str, Any]) -> bool:
+    """Whether the plugin rejected a command it has no handler for."""
+    return str(response.get("error", "")).startswith("Unknown command")
+
+async def _add_nodes(blueprint_name: str, nodes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Add nodes with one add_blueprint_nodes_batch command and return a response per node, in order.
+    
+    Each node is a "kind" from BATCH_NODE_KINDS plus the arguments of its single-node command.
+    If the plugin does not know the batch command (remembered for later calls), each node is
+    sent with its single-node command instead. A batch that fails as a whole reports its error
+    for every node rather than being retried node by node.
+    """
+    global _node_batch_unsupported
+    responses = None
+    if not _node_batch_unsupported:
+        response = await _send_node_command("add_blueprint_nodes_batch", {
+            "blueprint_name": blueprint_name,
+            "nodes": nodes
+        }, "adding nodes")
+        if _is_unknown_command(response):
+            logger.info("Unreal does not support 'add_blueprint_nodes_batch'; adding nodes individually")
+            _node_batch_unsupported = True
+        else:
+            payload = response.get("result") if isinstance(response.get("result"), dict) else response
+            results = payload.get("results")
+            responses = results if isinstance(results, list) and len(results) == len(nodes) else [response] * len(nodes)
+    
+    if responses is None:
+        responses = []
+        for node in nodes:
+            params = {key: value for key, value in node.items() if key != "kind"}
+            params["blueprint_name"] = blueprint_name
+            params.setdefault("node_position", DEFAULT_NODE_POSITION)
+            responses.append(await _send_node_command(BATCH_NODE_KINDS[node["kind"]], params, "adding node"))
+    
+    # A node class created for the first time may extend the node catalog
+    for node, response in zip(nodes, responses):
+        node_class = node.get("node_class")
+        if node["kind"] == "node" and _is_success(response) and node_class not in _created_node_classes:
+            _created_node_classes.add(node_class)
+            _invalidate_node_caches()
+    return responses
+
+async def _add_subgraph_individually(blueprint_name: str, nodes: List[Dict[str, Any]], wires: List[Dict[str, str]]) -> Dict[str, Any]:
+    """
+    Build a subgraph with _add_nodes and one connect_blueprint_nodes command per wire.
+    
+    Used when the plugin has no add_blueprint_subgraph handler. Stops at the first node or
+    wire that fails; node_ids then holds the nodes created so far.
+    """
+    responses = await _add_nodes(blueprint_name, [{"kind": node["kind"], **node.get("args", {})} for node in nodes])
+    
+    node_ids = {}
+    for node, response in zip(nodes, responses):
+        node_id = _node_id(response)
+        if not _is_success(response) or node_id is None:
+            error = response.get("error") or response.get("message") or "no node ID returned"
+            return {"success": False, "message": f"Failed to add node '{node['name']}': {error}", "node_ids": node_ids}
+        node_ids[node["name"]] = node_id
+    
+    for index, wire in enumerate(wires):
+        source_name, _, source_pin = wire["from"].partition(".")
+        target_name, _, target_pin = wire["to"].partition(".")
+        response = await _send_node_command("connect_blueprint_nodes", {
+            "blueprint_name": blueprint_name,
+            "source_node_id": node_ids[source_name],
+            "source_pin": source_pin,
+            "target_node_id": node_ids[target_name],
+            "target_pin": target_pin
+        }, "connecting nodes")
+        if not _is_success(response):
+            error = response.get("error") or response.get("message")
+            return {"success": False, "message": f"Failed to connect wire {index}: {error}", "node_ids": node_ids}
+    
+    return {"success": True, "node_ids": node_ids}
+
+async def _add_node(kind: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Add one node as a one-element _add_nodes call and return its response."""
+    node = {key: value for key, value in params.items() if key != "blueprint_name"}
+    node["kind"] = kind
+    return (await _add_nodes(params["blueprint_name"], [node]))[0]
+
 def register_blueprint_node_tools(mcp: FastMCP):
     """Register Blueprint node manipulation tools with the MCP server."""
     
     @mcp.tool()
-    def add_blueprint_event_node(
+    async def add_blueprint_event_node(
         ctx: Context,
         blueprint_name: str,
         event_name: str,
@@ -35,41 +191,21 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from unreal_mcp_server import get_unreal_connection
+        # Handle default value within the method body
+        if node_position is None:
+            node_position = DEFAULT_NODE_POSITION
         
-        try:
-            # Handle default value within the method body
-            if node_position is None:
-                node_position = [0, 0]
-            
-            params = {
-                "blueprint_name": blueprint_name,
-                "event_name": event_name,
-                "node_position": node_position
-            }
-            
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info(f"Adding event node '{event_name}' to blueprint '{blueprint_name}'")
-            response = unreal.send_command("add_blueprint_event_node", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Event node creation response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error adding event node: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        params = {
+            "blueprint_name": blueprint_name,
+            "event_name": event_name,
+            "node_position": node_position
+        }
+        
+        logger.info("Adding event node '%s' to blueprint '%s'", event_name, blueprint_name)
+        return await _add_node("event", params)
     
     @mcp.tool()
-    def add_blueprint_input_action_node(
+    async def add_blueprint_input_action_node(
         ctx: Context,
         blueprint_name: str,
         action_name: str,
@@ -86,41 +222,21 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from unreal_mcp_server import get_unreal_connection
+        # Handle default value within the method body
+        if node_position is None:
+            node_position = DEFAULT_NODE_POSITION
         
-        try:
-            # Handle default value within the method body
-            if node_position is None:
-                node_position = [0, 0]
-            
-            params = {
-                "blueprint_name": blueprint_name,
-                "action_name": action_name,
-                "node_position": node_position
-            }
-            
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info(f"Adding input action node for '{action_name}' to blueprint '{blueprint_name}'")
-            response = unreal.send_command("add_blueprint_input_action_node", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Input action node creation response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error adding input action node: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        params = {
+            "blueprint_name": blueprint_name,
+            "action_name": action_name,
+            "node_position": node_position
+        }
+        
+        logger.info("Adding input action node for '%s' to blueprint '%s'", action_name, blueprint_name)
+        return await _add_node("input_action", params)
     
     @mcp.tool()
-    def add_blueprint_function_node(
+    async def add_blueprint_function_node(
         ctx: Context,
         blueprint_name: str,
         target: str,
@@ -141,45 +257,25 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from unreal_mcp_server import get_unreal_connection
+        # Handle default values within the method body
+        if params is None:
+            params = {}
+        if node_position is None:
+            node_position = DEFAULT_NODE_POSITION
         
-        try:
-            # Handle default values within the method body
-            if params is None:
-                params = {}
-            if node_position is None:
-                node_position = [0, 0]
-            
-            command_params = {
-                "blueprint_name": blueprint_name,
-                "target": target,
-                "function_name": function_name,
-                "params": params,
-                "node_position": node_position
-            }
-            
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info(f"Adding function node '{function_name}' to blueprint '{blueprint_name}'")
-            response = unreal.send_command("add_blueprint_function_node", command_params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Function node creation response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error adding function node: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        command_params = {
+            "blueprint_name": blueprint_name,
+            "target": target,
+            "function_name": function_name,
+            "params": params,
+            "node_position": node_position
+        }
+        
+        logger.info("Adding function node '%s' to blueprint '%s'", function_name, blueprint_name)
+        return await _add_node("function", command_params)
     
     @mcp.tool()
-    def add_blueprint_variable_get_node(
+    async def add_blueprint_variable_get_node(
         ctx: Context,
         blueprint_name: str,
         variable_name: str,
@@ -196,40 +292,20 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from unreal_mcp_server import get_unreal_connection
+        if node_position is None:
+            node_position = DEFAULT_NODE_POSITION
         
-        try:
-            if node_position is None:
-                node_position = [0, 0]
-            
-            params = {
-                "blueprint_name": blueprint_name,
-                "variable_name": variable_name,
-                "node_position": node_position
-            }
-            
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info(f"Adding variable get node for '{variable_name}' to blueprint '{blueprint_name}'")
-            response = unreal.send_command("add_blueprint_variable_get_node", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Variable get node creation response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error adding variable get node: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        params = {
+            "blueprint_name": blueprint_name,
+            "variable_name": variable_name,
+            "node_position": node_position
+        }
+        
+        logger.info("Adding variable get node for '%s' to blueprint '%s'", variable_name, blueprint_name)
+        return await _add_node("variable_get", params)
     
     @mcp.tool()
-    def add_blueprint_variable_set_node(
+    async def add_blueprint_variable_set_node(
         ctx: Context,
         blueprint_name: str,
         variable_name: str,
@@ -246,40 +322,20 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from unreal_mcp_server import get_unreal_connection
+        if node_position is None:
+            node_position = DEFAULT_NODE_POSITION
         
-        try:
-            if node_position is None:
-                node_position = [0, 0]
-            
-            params = {
-                "blueprint_name": blueprint_name,
-                "variable_name": variable_name,
-                "node_position": node_position
-            }
-            
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info(f"Adding variable set node for '{variable_name}' to blueprint '{blueprint_name}'")
-            response = unreal.send_command("add_blueprint_variable_set_node", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Variable set node creation response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error adding variable set node: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        params = {
+            "blueprint_name": blueprint_name,
+            "variable_name": variable_name,
+            "node_position": node_position
+        }
+        
+        logger.info("Adding variable set node for '%s' to blueprint '%s'", variable_name, blueprint_name)
+        return await _add_node("variable_set", params)
     
     @mcp.tool()
-    def add_blueprint_math_node(
+    async def add_blueprint_math_node(
         ctx: Context,
         blueprint_name: str,
         math_operation: str,
@@ -296,40 +352,20 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from unreal_mcp_server import get_unreal_connection
+        if node_position is None:
+            node_position = DEFAULT_NODE_POSITION
         
-        try:
-            if node_position is None:
-                node_position = [0, 0]
-            
-            params = {
-                "blueprint_name": blueprint_name,
-                "math_operation": math_operation,
-                "node_position": node_position
-            }
-            
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info(f"Adding math node '{math_operation}' to blueprint '{blueprint_name}'")
-            response = unreal.send_command("add_blueprint_math_node", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Math node creation response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error adding math node: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        params = {
+            "blueprint_name": blueprint_name,
+            "math_operation": math_operation,
+            "node_position": node_position
+        }
+        
+        logger.info("Adding math node '%s' to blueprint '%s'", math_operation, blueprint_name)
+        return await _add_node("math", params)
     
     @mcp.tool()
-    def add_blueprint_branch_node(
+    async def add_blueprint_branch_node(
         ctx: Context,
         blueprint_name: str,
         node_position = None
@@ -344,39 +380,19 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from unreal_mcp_server import get_unreal_connection
+        if node_position is None:
+            node_position = DEFAULT_NODE_POSITION
         
-        try:
-            if node_position is None:
-                node_position = [0, 0]
-            
-            params = {
-                "blueprint_name": blueprint_name,
-                "node_position": node_position
-            }
-            
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info(f"Adding branch node to blueprint '{blueprint_name}'")
-            response = unreal.send_command("add_blueprint_branch_node", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Branch node creation response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error adding branch node: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        params = {
+            "blueprint_name": blueprint_name,
+            "node_position": node_position
+        }
+        
+        logger.info("Adding branch node to blueprint '%s'", blueprint_name)
+        return await _add_node("branch", params)
             
     @mcp.tool()
-    def connect_blueprint_nodes(
+    async def connect_blueprint_nodes(
         ctx: Context,
         blueprint_name: str,
         source_node_id: str,
@@ -397,39 +413,19 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from unreal_mcp_server import get_unreal_connection
+        params = {
+            "blueprint_name": blueprint_name,
+            "source_node_id": source_node_id,
+            "source_pin": source_pin,
+            "target_node_id": target_node_id,
+            "target_pin": target_pin
+        }
         
-        try:
-            params = {
-                "blueprint_name": blueprint_name,
-                "source_node_id": source_node_id,
-                "source_pin": source_pin,
-                "target_node_id": target_node_id,
-                "target_pin": target_pin
-            }
-            
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info(f"Connecting nodes in blueprint '{blueprint_name}'")
-            response = unreal.send_command("connect_blueprint_nodes", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Node connection response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error connecting nodes: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        logger.info("Connecting nodes in blueprint '%s'", blueprint_name)
+        return await _send_node_command("connect_blueprint_nodes", params, "connecting nodes")
     
     @mcp.tool()
-    def add_blueprint_variable(
+    async def add_blueprint_variable(
         ctx: Context,
         blueprint_name: str,
         variable_name: str,
@@ -448,38 +444,18 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from unreal_mcp_server import get_unreal_connection
+        params = {
+            "blueprint_name": blueprint_name,
+            "variable_name": variable_name,
+            "variable_type": variable_type,
+            "is_exposed": is_exposed
+        }
         
-        try:
-            params = {
-                "blueprint_name": blueprint_name,
-                "variable_name": variable_name,
-                "variable_type": variable_type,
-                "is_exposed": is_exposed
-            }
-            
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info(f"Adding variable '{variable_name}' to blueprint '{blueprint_name}'")
-            response = unreal.send_command("add_blueprint_variable", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Variable creation response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error adding variable: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        logger.info("Adding variable '%s' to blueprint '%s'", variable_name, blueprint_name)
+        return await _send_node_command("add_blueprint_variable", params, "adding variable")
     
     @mcp.tool()
-    def add_blueprint_get_self_component_reference(
+    async def add_blueprint_get_self_component_reference(
         ctx: Context,
         blueprint_name: str,
         component_name: str,
@@ -497,41 +473,21 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from unreal_mcp_server import get_unreal_connection
+        # Handle None case explicitly in the function
+        if node_position is None:
+            node_position = DEFAULT_NODE_POSITION
         
-        try:
-            # Handle None case explicitly in the function
-            if node_position is None:
-                node_position = [0, 0]
-            
-            params = {
-                "blueprint_name": blueprint_name,
-                "component_name": component_name,
-                "node_position": node_position
-            }
-            
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info(f"Adding self component reference node for '{component_name}' to blueprint '{blueprint_name}'")
-            response = unreal.send_command("add_blueprint_get_self_component_reference", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Self component reference node creation response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error adding self component reference node: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        params = {
+            "blueprint_name": blueprint_name,
+            "component_name": component_name,
+            "node_position": node_position
+        }
+        
+        logger.info("Adding self component reference node for '%s' to blueprint '%s'", component_name, blueprint_name)
+        return await _add_node("self_component_reference", params)
     
     @mcp.tool()
-    def add_blueprint_self_reference(
+    async def add_blueprint_self_reference(
         ctx: Context,
         blueprint_name: str,
         node_position = None
@@ -546,39 +502,19 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from unreal_mcp_server import get_unreal_connection
-        
-        try:
-            if node_position is None:
-                node_position = [0, 0]
-                
-            params = {
-                "blueprint_name": blueprint_name,
-                "node_position": node_position
-            }
-            
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info(f"Adding self reference node to blueprint '{blueprint_name}'")
-            response = unreal.send_command("add_blueprint_self_reference", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
+        if node_position is None:
+            node_position = DEFAULT_NODE_POSITION
             
-            logger.info(f"Self reference node creation response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error adding self reference node: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        params = {
+            "blueprint_name": blueprint_name,
+            "node_position": node_position
+        }
+        
+        logger.info("Adding self reference node to blueprint '%s'", blueprint_name)
+        return await _add_node("self_reference", params)
     
     @mcp.tool()
-    def find_blueprint_nodes(
+    async def find_blueprint_nodes(
         ctx: Context,
         blueprint_name: str,
         node_type = None,
@@ -595,39 +531,19 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing array of found node IDs and success status
         """
-        from unreal_mcp_server import get_unreal_connection
+        params = {
+            "blueprint_name": blueprint_name,
+            "node_type": node_type,
+            "event_type": event_type
+        }
         
-        try:
-            params = {
-                "blueprint_name": blueprint_name,
-                "node_type": node_type,
-                "event_type": event_type
-            }
-            
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info(f"Finding nodes in blueprint '{blueprint_name}'")
-            response = unreal.send_command("find_blueprint_nodes", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Node find response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error finding nodes: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        logger.info("Finding nodes in blueprint '%s'", blueprint_name)
+        return await _send_node_command("find_blueprint_nodes", params, "finding nodes")
     
     # ===== DYNAMIC BLUEPRINT NODE TOOLS =====
     
     @mcp.tool()
-    def create_blueprint_node(
+    async def create_blueprint_node(
         ctx: Context,
         blueprint_name: str,
         node_class: str,
@@ -644,40 +560,20 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from unreal_mcp_server import get_unreal_connection
+        if node_position is None:
+            node_position = DEFAULT_NODE_POSITION
         
-        try:
-            if node_position is None:
-                node_position = [0, 0]
-            
-            params = {
-                "blueprint_name": blueprint_name,
-                "node_class": node_class,
-                "node_position": node_position
-            }
-            
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info(f"Creating {node_class} node in blueprint '{blueprint_name}'")
-            response = unreal.send_command("create_blueprint_node", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Node creation response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error creating node: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        params = {
+            "blueprint_name": blueprint_name,
+            "node_class": node_class,
+            "node_position": node_position
+        }
+        
+        logger.info("Creating %s node in blueprint '%s'", node_class, blueprint_name)
+        return await _add_node("node", params)
     
     @mcp.tool()
-    def get_available_blueprint_nodes(
+    async def get_available_blueprint_nodes(
         ctx: Context
     ) -> Dict[str, Any]:
         """
@@ -686,31 +582,22 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Dict containing categorized list of available node types
         """
-        from unreal_mcp_server import get_unreal_connection
+        global _node_catalog_cache
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info("Discovering available Blueprint node types")
-            response = unreal.send_command("get_available_blueprint_nodes", {})
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Node discovery response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error discovering nodes: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        if _node_catalog_cache and time.monotonic() - _node_catalog_cache[0] < NODE_CATALOG_TTL:
+            logger.debug("Serving Blueprint node types from cache")
+            return _node_catalog_cache[1]
+        
+        logger.info("Discovering available Blueprint node types")
+        response = await _send_node_command("get_available_blueprint_nodes", {}, "discovering nodes")
+        
+        if _is_success(response):
+            _node_catalog_cache = (time.monotonic(), response)
+        
+        return response
 
     @mcp.tool()
-    def get_blueprint_node_info(
+    async def get_blueprint_node_info(
         ctx: Context,
         node_class: str
     ) -> Dict[str, Any]:
@@ -723,31 +610,130 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Dict containing detailed node information
         """
-        from unreal_mcp_server import get_unreal_connection
+        cached = _node_info_cache.get(node_class)
+        if cached is not None:
+            _node_info_cache.move_to_end(node_class)
+            return cached
         
-        try:
-            params = {
-                "node_class": node_class
-            }
-            
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info(f"Getting info for node class '{node_class}'")
-            response = unreal.send_command("get_blueprint_node_info", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
+        params = {
+            "node_class": node_class
+        }
+        
+        logger.info("Getting info for node class '%s'", node_class)
+        response = await _send_node_command("get_blueprint_node_info", params, "getting node info")
+        
+        if _is_success(response):
+            _node_info_cache[node_class] = response
+            if len(_node_info_cache) > NODE_INFO_CACHE_SIZE:
+                _node_info_cache.popitem(last=False)
+        
+        return response
+    
+    @mcp.tool()
+    def invalidate_blueprint_node_cache(ctx: Context) -> Dict[str, Any]:
+        """
+        Clear cached results of get_available_blueprint_nodes and get_blueprint_node_info.
+        
+        Use after installing plugins or compiling code that adds new node classes.
+        
+        Returns:
+            Response indicating success
+        """
+        _invalidate_node_caches()
+        logger.info("Blueprint node caches invalidated")
+        return {"success": True, "message": "Blueprint node caches cleared"}
+
+    @mcp.tool()
+    async def add_blueprint_nodes(
+        ctx: Context,
+        blueprint_name: str,
+        nodes: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Add several nodes to a Blueprint's event graph in a single round-trip.
+        
+        Plugins without a batch handler get one command per node instead, with the same result.
+        
+        Args:
+            blueprint_name: Name of the target Blueprint
+            nodes: Node specs, each with a "kind" plus the arguments of the matching
+                   single-node tool, e.g. {"kind": "event", "event_name": "ReceiveBeginPlay"}.
+                   Kinds: event, input_action, function, variable_get, variable_set, math,
+                   branch, self_component_reference, self_reference, node (create_blueprint_node)
             
-            logger.info(f"Node info response: {response}")
-            return response
+        Returns:
+            Response containing a results list aligned with nodes, each with node_id and success
+        """
+        for index, node in enumerate(nodes):
+            kind = node.get("kind")
+            if kind not in BATCH_NODE_KINDS:
+                return {"success": False, "message": f"Unknown node kind at index {index}: {kind}"}
+        
+        logger.info("Adding %s nodes to blueprint '%s'", len(nodes), blueprint_name)
+        responses = await _add_nodes(blueprint_name, nodes)
+        
+        results = []
+        for response in responses:
+            result = {"node_id": _node_id(response), "success": _is_success(response)}
+            if not result["success"]:
+                result["error"] = response.get("error") or response.get("message")
+            results.append(result)
+        return {"success": all(result["success"] for result in results), "results": results}
+
+    @mcp.tool()
+    async def add_blueprint_subgraph(
+        ctx: Context,
+        blueprint_name: str,
+        nodes: List[Dict[str, Any]],
+        wires: List[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """
+        Add nodes and the connections between them to a Blueprint in a single round-trip.
+        
+        Plugins without a subgraph handler get the nodes first and then one connect command per wire.
+        
+        Args:
+            blueprint_name: Name of the target Blueprint
+            nodes: Node specs, each with a unique "name", a "kind" (see add_blueprint_nodes)
+                   and optional "args" for the matching single-node tool,
+                   e.g. {"name": "begin", "kind": "event", "args": {"event_name": "ReceiveBeginPlay"}}
+            wires: Connections between named nodes as "node_name.pin_name" references,
+                   e.g. {"from": "begin.then", "to": "print.execute"}
             
-        except Exception as e:
-            error_msg = f"Error getting node info: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        Returns:
+            Response containing node_ids, a mapping from node name to created node ID
+        """
+        global _subgraph_unsupported
+        
+        names = set()
+        for index, node in enumerate(nodes):
+            name = node.get("name")
+            if not name or name in names:
+                return {"success": False, "message": f"Missing or duplicate node name at index {index}: {name}"}
+            if node.get("kind") not in BATCH_NODE_KINDS:
+                return {"success": False, "message": f"Unknown node kind at index {index}: {node.get('kind')}"}
+            names.add(name)
+        
+        for index, wire in enumerate(wires):
+            for end in ("from", "to"):
+                node_name, _, pin_name = str(wire.get(end, "")).partition(".")
+                if node_name not in names or not pin_name:
+                    return {"success": False, "message": f"Invalid '{end}' reference in wire {index}: {wire.get(end)}"}
+        
+        params = {
+            "blueprint_name": blueprint_name,
+            "nodes": nodes,
+            "wires": wires
+        }
+        
+        logger.info("Adding subgraph of %s nodes and %s wires to blueprint '%s'", len(nodes), len(wires), blueprint_name)
+        if not _subgraph_unsupported:
+            response = await _send_node_command("add_blueprint_subgraph", params, "adding subgraph")
+            if not _is_unknown_command(response):
+                return response
+            logger.info("Unreal does not support 'add_blueprint_subgraph'; adding nodes and wires individually")
+            _subgraph_unsupported = True
+        
+        return await _add_subgraph_individually(blueprint_name, nodes, wires)
 
     logger.info("Dynamic Blueprint node tools registered successfully")
\ No newline at end of file
@@ -6,19 +6,259 @@ Includes project settings, plugin management, build configuration, project infor
 and configuration management capabilities.
 """
 
+import asyncio
 import logging
 import json
-from typing import Dict, Any, List, Optional
+import os
+import stat
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 from pathlib import Path
 from mcp.server.fastmcp import FastMCP, Context
+from pydantic import ValidationError
+from tools.command_batcher import CommandBatcher, get_shared_pool, unreal_tool
+from tools.config_manager import config_checksum, get_config_manager, ConfigManager, ToolConfig, UnrealMCPConfig
+
+# orjson is optional; its decode errors subclass json.JSONDecodeError, so handlers need no change
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 # Get logger
 logger = logging.getLogger("UnrealMCP")
 
+# Log messages repeated on every call of the read-only tools
+_MSG_PROJECT_INFO = "Retrieving project information"
+_MSG_ENGINE_SETTINGS = "Retrieving engine settings"
+_MSG_PLUGIN_INFO = "Retrieving plugin info for '%s'"
+_MSG_ALL_PLUGIN_INFO = "Retrieving all plugin information"
+_MSG_BUILD_TARGETS = "Retrieving build targets information"
+_MSG_PROJECT_DIAGNOSTICS = "Retrieving project diagnostics"
+
+# Input mapping types accepted by create_input_mapping
+VALID_INPUT_TYPES = frozenset({"Action", "Axis"})
+
+# Frequently bound Unreal key names; other keys are still sent but logged as unusual
+COMMON_INPUT_KEYS = frozenset(
+    [chr(c) for c in range(ord("A"), ord("Z") + 1)]
+    + ["Zero", "One", "Two", "Three", "Four", "Five", "Six", "Seven", "Eight", "Nine"]
+    + [f"F{n}" for n in range(1, 13)]
+    + [
+        "SpaceBar", "Enter", "Escape", "Tab", "BackSpace", "Delete", "Insert", "Home", "End",
+        "PageUp", "PageDown", "Up", "Down", "Left", "Right",
+        "LeftShift", "RightShift", "LeftControl", "RightControl", "LeftAlt", "RightAlt",
+        "LeftMouseButton", "RightMouseButton", "MiddleMouseButton", "ThumbMouseButton",
+        "ThumbMouseButton2", "MouseX", "MouseY", "MouseWheelAxis", "MouseScrollUp", "MouseScrollDown",
+        "Gamepad_FaceButton_Bottom", "Gamepad_FaceButton_Right", "Gamepad_FaceButton_Left",
+        "Gamepad_FaceButton_Top", "Gamepad_LeftShoulder", "Gamepad_RightShoulder",
+        "Gamepad_LeftTrigger", "Gamepad_RightTrigger", "Gamepad_LeftTriggerAxis",
+        "Gamepad_RightTriggerAxis", "Gamepad_LeftX", "Gamepad_LeftY", "Gamepad_RightX",
+        "Gamepad_RightY", "Gamepad_DPad_Up", "Gamepad_DPad_Down", "Gamepad_DPad_Left",
+        "Gamepad_DPad_Right", "Gamepad_Special_Left", "Gamepad_Special_Right",
+        "Gamepad_LeftThumbstick", "Gamepad_RightThumbstick",
+    ]
+)
+
+# File extensions list_config_files reports as configuration files (a tuple, for str.endswith)
+CONFIG_FILE_EXTENSIONS = (".yaml", ".yml", ".json", ".toml")
+
+class ConfigFileEntry(NamedTuple):
+    """A configuration file found by list_config_files."""
+    name: str
+    path: str
+    size: int
+    modified: float
+
+def _scan_config_files(directory: str, seen: set):
+    """
+    Yield a ConfigFileEntry for each configuration file directly inside directory.
+    
+    Files whose (st_dev, st_ino) is already in seen are skipped, and yielded files are added
+    to it. Windows reports no inode numbers for directory entries, so nothing is skipped there.
+    """
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.lower().endswith(CONFIG_FILE_EXTENSIONS) and entry.is_file(follow_symlinks=False):
+                    file_stat = entry.stat(follow_symlinks=False)
+                    if file_stat.st_ino:
+                        file_id = (file_stat.st_dev, file_stat.st_ino)
+                        if file_id in seen:
+                            continue
+                        seen.add(file_id)
+                    yield ConfigFileEntry(entry.name, entry.path, file_stat.st_size, file_stat.st_mtime)
+    except FileNotFoundError:
+        return
+
+def _iter_config_files(config_dir: str, extra_dir: Optional[str]):
+    """Yield the configuration files in config_dir, then those in extra_dir (if given) not already yielded."""
+    seen = set()
+    yield from _scan_config_files(config_dir, seen)
+    if extra_dir:
+        yield from _scan_config_files(extra_dir, seen)
+
+# Directory listings kept by _list_config_files
+CONFIG_LIST_CACHE_SIZE = 16
+
+# (config dir, extra dir) -> (directory mtimes, monotonic timestamp, entries), least recently used first
+_config_list_cache: "OrderedDict[Tuple[str, Optional[str]], Tuple[Tuple[int, ...], float, List[ConfigFileEntry]]]" = OrderedDict()
+
+def _list_config_files(config_dir: str, extra_dir: Optional[str]) -> List[ConfigFileEntry]:
+    """
+    List the configuration files in config_dir and, if given, extra_dir.
+    
+    A listing is reused while neither directory's mtime has changed. Editing a file in place
+    does not touch its directory, so a listing is also dropped after READ_CACHE_TTL seconds
+    to keep sizes and modification times current.
+    """
+    key = (config_dir, extra_dir)
+    try:
+        mtimes = tuple(os.stat(path).st_mtime_ns for path in key if path)
+    except OSError:
+        mtimes = None
+    
+    cached = _config_list_cache.get(key)
+    if cached and mtimes is not None and cached[0] == mtimes and time.monotonic() - cached[1] < READ_CACHE_TTL:
+        _config_list_cache.move_to_end(key)
+        return cached[2]
+    
+    entries = list(_iter_config_files(config_dir, extra_dir))
+    
+    if mtimes is not None:
+        _config_list_cache[key] = (mtimes, time.monotonic(), entries)
+        _config_list_cache.move_to_end(key)
+        if len(_config_list_cache) > CONFIG_LIST_CACHE_SIZE:
+            _config_list_cache.popitem(last=False)
+    return entries
+
+# Seconds a read-only project query result is reused
+READ_CACHE_TTL = 5.0
+
+# (command, frozenset(params.items())) -> (monotonic timestamp, response) for read-only queries
+_read_cache: Dict[Tuple[str, frozenset], Tuple[float, Dict[str, Any]]] = {}
+
+# (manifest fingerprint, response) for the full plugin list returned by get_plugin_info
+_plugin_list_cache: Optional[Tuple[frozenset, Dict[str, Any]]] = None
+
+def invalidate_read_cache():
+    """Forget cached results of read-only project queries."""
+    global _plugin_list_cache
+    _read_cache.clear()
+    _plugin_list_cache = None
+
+def _is_success(response: Optional[Dict[str, Any]]) -> bool:
+    """Return True if an Unreal response reports success."""
+    return bool(response) and response.get("status") != "error" and response.get("success") is not False
+
+async def _cached_read(command: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Send a read-only command, reusing a successful response younger than READ_CACHE_TTL."""
+    key = (command, frozenset(params.items()))
+    cached = _read_cache.get(key)
+    if cached and time.monotonic() - cached[0] < READ_CACHE_TTL:
+        logger.debug("Serving '%s' from cache", command)
+        return cached[1]
+    
+    response = await _send_command(command, params)
+    if _is_success(response):
+        _read_cache[key] = (time.monotonic(), response)
+    return response
+
+def _plugin_manifest_fingerprint() -> Optional[frozenset]:
+    """
+    Fingerprint the project's plugin manifests.
+    
+    Returns:
+        (path, mtime) pairs for the configured .uproject and every .uplugin under the
+        project's Plugins folder, or None if no project path is configured
+    """
+    project_path = get_config_manager().get_config().project.project_path
+    if not project_path:
+        return None
+    try:
+        project_stat = os.stat(project_path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(project_stat.st_mode):
+        return None
+    
+    entries = [(project_path, project_stat.st_mtime)]
+    pending = [os.path.join(os.path.dirname(project_path), "Plugins")]
+    while pending:
+        subdirs = []
+        is_plugin_root = False
+        try:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.endswith(".uplugin"):
+                        entries.append((entry.path, entry.stat().st_mtime))
+                        is_plugin_root = True
+        except OSError:
+            continue
+        # Plugins do not nest, so a plugin's own content is never scanned
+        if not is_plugin_root:
+            pending.extend(subdirs)
+    return frozenset(entries)
+
+async def _plugin_info_read(command: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Send get_plugin_info, serving the full plugin list locally while no plugin manifest has changed."""
+    global _plugin_list_cache
+    if params:
+        return await _cached_read(command, params)
+    
+    fingerprint = _plugin_manifest_fingerprint()
+    if fingerprint is not None and _plugin_list_cache and _plugin_list_cache[0] == fingerprint:
+        logger.debug("Serving plugin list from cache; plugin manifests unchanged")
+        return _plugin_list_cache[1]
+    
+    response = await _send_command(command, params)
+    if fingerprint is not None and _is_success(response):
+        _plugin_list_cache = (fingerprint, response)
+    return response
+
+async def _send_command(command: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Send a command over the shared connection pool without caching; raises on transport errors."""
+    async with get_shared_pool().acquire() as unreal:
+        return await unreal.send_command(command, params)
+
+# Set once the plugin answers set_engine_setting_bulk with "Unknown command"
+_settings_bulk_unsupported = False
+
+# Shared batcher for the write-heavy project tools; writes can change what the read-only queries report
+_batcher = CommandBatcher(on_complete=lambda params: invalidate_read_cache())
+
+async def _send_settings_bulk(command: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Send a grouped engine-setting write, clearing the read cache once for the whole group.
+    
+    If the plugin does not know the grouped command (remembered for later calls), each
+    setting is submitted as a set_engine_setting call instead and the individual responses
+    are returned as "results".
+    """
+    global _settings_bulk_unsupported
+    try:
+        if not _settings_bulk_unsupported:
+            response = await _send_command(command, params)
+            if not (response and str(response.get("error", "")).startswith("Unknown command")):
+                return response
+            logger.info("Unreal does not support '%s'; sending settings individually", command)
+            _settings_bulk_unsupported = True
+        
+        results = await asyncio.gather(
+            *(_batcher.submit("set_engine_setting", setting) for setting in params["settings"])
+        )
+        return {"success": all(_is_success(result) for result in results), "results": results}
+    finally:
+        invalidate_read_cache()
+
 def register_project_tools(mcp: FastMCP):
     """Register project tools with the MCP server."""
     
     @mcp.tool()
+    @unreal_tool("create_input_mapping", "creating input mapping", _batcher.submit)
     def create_input_mapping(
         ctx: Context,
         action_name: str,
@@ -44,40 +284,28 @@ def register_project_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from unreal_mcp_server import get_unreal_connection
-        
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {
-                "action_name": action_name,
-                "key": key,
-                "input_type": input_type,
-                "shift": shift,
-                "ctrl": ctrl,
-                "alt": alt,
-                "cmd": cmd
-            }
-            
-            logger.info(f"Creating input mapping '{action_name}' with key '{key}' and modifiers: shift={shift}, ctrl={ctrl}, alt={alt}, cmd={cmd}")
-            response = unreal.send_command("create_input_mapping", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Input mapping creation response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error creating input mapping: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        if input_type not in VALID_INPUT_TYPES:
+            raise ValueError(f"Invalid input_type '{input_type}', expected one of: {', '.join(sorted(VALID_INPUT_TYPES))}")
+        if key not in COMMON_INPUT_KEYS:
+            logger.warning("Key '%s' is not a common Unreal key name; Unreal may reject it", key)
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Creating input mapping '%s' with key '%s' and modifiers: shift=%s, ctrl=%s, alt=%s, cmd=%s",
+                        action_name, key, shift, ctrl, alt, cmd)
+        
+        # Built straight into the return; a dict literal is the cheapest way to make this payload
+        return {
+            "action_name": action_name,
+            "key": key,
+            "input_type": input_type,
+            "shift": shift,
+            "ctrl": ctrl,
+            "alt": alt,
+            "cmd": cmd
+        }
     
     @mcp.tool()
+    @unreal_tool("get_project_info", "getting project info", _cached_read)
     def get_project_info(
         ctx: Context
     ) -> Dict[str, Any]:
@@ -87,30 +315,11 @@ def register_project_tools(mcp: FastMCP):
         Returns:
             Dict containing project details including name, engine version, modules, plugins
         """
-        from unreal_mcp_server import get_unreal_connection
-        
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info("Retrieving project information")
-            response = unreal.send_command("get_project_info", {})
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Project info response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error getting project info: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        logger.info(_MSG_PROJECT_INFO)
+        return {}
     
     @mcp.tool()
+    @unreal_tool("get_engine_settings", "getting engine settings", _cached_read)
     def get_engine_settings(
         ctx: Context
     ) -> Dict[str, Any]:
@@ -120,30 +329,11 @@ def register_project_tools(mcp: FastMCP):
         Returns:
             Dict containing engine settings information
         """
-        from unreal_mcp_server import get_unreal_connection
-        
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info("Retrieving engine settings")
-            response = unreal.send_command("get_engine_settings", {})
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Engine settings response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error getting engine settings: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        logger.info(_MSG_ENGINE_SETTINGS)
+        return {}
     
     @mcp.tool()
+    @unreal_tool("set_engine_setting", "setting engine setting", _batcher.submit)
     def set_engine_setting(
         ctx: Context,
         setting_name: str,
@@ -161,36 +351,50 @@ def register_project_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from unreal_mcp_server import get_unreal_connection
+        params = {
+            "setting_name": setting_name,
+            "setting_value": setting_value,
+            "section": section
+        }
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {
-                "setting_name": setting_name,
-                "setting_value": setting_value,
-                "section": section
-            }
-            
-            logger.info(f"Setting engine setting '{setting_name}' to '{setting_value}' in section '{section}'")
-            response = unreal.send_command("set_engine_setting", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Engine setting update response: {response}")
-            return response
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Setting engine setting '%s' to '%s' in section '%s'", setting_name, setting_value, section)
+        return params
+    
+    @mcp.tool()
+    @unreal_tool("set_engine_setting_bulk", "setting engine settings", _send_settings_bulk)
+    def set_engine_settings_bulk(
+        ctx: Context,
+        settings: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Set several engine setting values in one request.
+        
+        Args:
+            settings: List of settings, each with "setting_name", "setting_value" and
+                      an optional "section" (default: SystemSettings)
             
-        except Exception as e:
-            error_msg = f"Error setting engine setting: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        Returns:
+            Response indicating success or failure
+        """
+        if not settings:
+            raise ValueError("settings must contain at least one setting")
+        
+        grouped = []
+        for setting in settings:
+            if "setting_name" not in setting or "setting_value" not in setting:
+                raise ValueError(f"Setting is missing 'setting_name' or 'setting_value': {setting}")
+            grouped.append({
+                "setting_name": setting["setting_name"],
+                "setting_value": str(setting["setting_value"]),
+                "section": setting.get("section", "SystemSettings")
+            })
+        
+        logger.info("Setting %d engine settings", len(grouped))
+        return {"settings": grouped}
     
     @mcp.tool()
+    @unreal_tool("get_plugin_info", "getting plugin info", _plugin_info_read)
     def get_plugin_info(
         ctx: Context,
         plugin_name: str = None
@@ -204,36 +408,16 @@ def register_project_tools(mcp: FastMCP):
         Returns:
             Dict containing plugin information
         """
-        from unreal_mcp_server import get_unreal_connection
-        
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {}
-            if plugin_name:
-                params["plugin_name"] = plugin_name
-                logger.info(f"Retrieving plugin info for '{plugin_name}'")
-            else:
-                logger.info("Retrieving all plugin information")
-            
-            response = unreal.send_command("get_plugin_info", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Plugin info response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error getting plugin info: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        params = {}
+        if plugin_name:
+            params["plugin_name"] = plugin_name
+            logger.info(_MSG_PLUGIN_INFO, plugin_name)
+        else:
+            logger.info(_MSG_ALL_PLUGIN_INFO)
+        return params
     
     @mcp.tool()
+    @unreal_tool("enable_plugin", "enabling plugin", _batcher.submit)
     def enable_plugin(
         ctx: Context,
         plugin_name: str
@@ -247,32 +431,13 @@ def register_project_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from unreal_mcp_server import get_unreal_connection
+        params = {"plugin_name": plugin_name}
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {"plugin_name": plugin_name}
-            
-            logger.info(f"Enabling plugin '{plugin_name}'")
-            response = unreal.send_command("enable_plugin", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Plugin enable response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error enabling plugin: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        logger.info("Enabling plugin '%s'", plugin_name)
+        return params
     
     @mcp.tool()
+    @unreal_tool("disable_plugin", "disabling plugin", _batcher.submit)
     def disable_plugin(
         ctx: Context,
         plugin_name: str
@@ -286,32 +451,13 @@ def register_project_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from unreal_mcp_server import get_unreal_connection
+        params = {"plugin_name": plugin_name}
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {"plugin_name": plugin_name}
-            
-            logger.info(f"Disabling plugin '{plugin_name}'")
-            response = unreal.send_command("disable_plugin", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Plugin disable response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error disabling plugin: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        logger.info("Disabling plugin '%s'", plugin_name)
+        return params
     
     @mcp.tool()
+    @unreal_tool("get_build_targets", "getting build targets", _cached_read)
     def get_build_targets(
         ctx: Context
     ) -> Dict[str, Any]:
@@ -321,30 +467,11 @@ def register_project_tools(mcp: FastMCP):
         Returns:
             Dict containing build targets information
         """
-        from unreal_mcp_server import get_unreal_connection
-        
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info("Retrieving build targets information")
-            response = unreal.send_command("get_build_targets", {})
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Build targets response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error getting build targets: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        logger.info(_MSG_BUILD_TARGETS)
+        return {}
     
     @mcp.tool()
+    @unreal_tool("create_content_folder", "creating content folder", _batcher.submit)
     def create_content_folder(
         ctx: Context,
         folder_path: str,
@@ -360,35 +487,16 @@ def register_project_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from unreal_mcp_server import get_unreal_connection
+        params = {
+            "folder_path": folder_path,
+            "folder_name": folder_name
+        }
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {
-                "folder_path": folder_path,
-                "folder_name": folder_name
-            }
-            
-            logger.info(f"Creating content folder '{folder_name}' at path '{folder_path}'")
-            response = unreal.send_command("create_content_folder", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Content folder creation response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error creating content folder: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        logger.info("Creating content folder '%s' at path '%s'", folder_name, folder_path)
+        return params
     
     @mcp.tool()
+    @unreal_tool("get_project_diagnostics", "getting project diagnostics", _cached_read)
     def get_project_diagnostics(
         ctx: Context
     ) -> Dict[str, Any]:
@@ -398,30 +506,11 @@ def register_project_tools(mcp: FastMCP):
         Returns:
             Dict containing project diagnostics including warnings, errors, and recommendations
         """
-        from unreal_mcp_server import get_unreal_connection
-        
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info("Retrieving project diagnostics")
-            response = unreal.send_command("get_project_diagnostics", {})
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Project diagnostics response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error getting project diagnostics: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        logger.info(_MSG_PROJECT_DIAGNOSTICS)
+        return {}
     
     @mcp.tool()
+    @unreal_tool("validate_project", "validating project", _send_command)
     def validate_project(
         ctx: Context,
         check_plugins: bool = True,
@@ -439,34 +528,16 @@ def register_project_tools(mcp: FastMCP):
         Returns:
             Dict containing validation results and any issues found
         """
-        from unreal_mcp_server import get_unreal_connection
+        params = {
+            "check_plugins": check_plugins,
+            "check_blueprints": check_blueprints,
+            "check_assets": check_assets
+        }
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {
-                "check_plugins": check_plugins,
-                "check_blueprints": check_blueprints,
-                "check_assets": check_assets
-            }
-            
-            logger.info(f"Validating project with options: plugins={check_plugins}, blueprints={check_blueprints}, assets={check_assets}")
-            response = unreal.send_command("validate_project", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Project validation response: {response}")
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error validating project: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Validating project with options: plugins=%s, blueprints=%s, assets=%s",
+                        check_plugins, check_blueprints, check_assets)
+        return params
     
     @mcp.tool()
     def get_config_info(
@@ -479,13 +550,10 @@ def register_project_tools(mcp: FastMCP):
             Dict containing current configuration details
         """
         try:
-            from tools.config_manager import get_config_manager
-            
             config_manager = get_config_manager()
-            config = config_manager.get_config()
             
-            # Convert config to dict for JSON serialization
-            config_dict = config.dict()
+            # Cached JSON-ready dump of the current configuration
+            config_dict = config_manager.get_config_dict()
             
             # Add metadata
             result = {
@@ -493,6 +561,7 @@ def register_project_tools(mcp: FastMCP):
                 "config_file": str(config_manager._config_file_path) if config_manager._config_file_path else None,
                 "config_dir": str(config_manager.config_dir),
                 "last_modified": config_manager._last_modified,
+                "checksum": config_manager.get_config_checksum(),
                 "configuration": config_dict
             }
             
@@ -507,39 +576,40 @@ def register_project_tools(mcp: FastMCP):
     @mcp.tool()
     def load_config_file(
         ctx: Context,
-        config_file: str = None
+        config_file: str = None,
+        include_config: bool = False
     ) -> Dict[str, Any]:
         """
         Load configuration from a file.
         
         Args:
             config_file: Path to configuration file (optional, will auto-detect if not provided)
+            include_config: Whether to include the loaded configuration in the response
             
         Returns:
-            Response indicating success or failure with loaded configuration
+            Response indicating success or failure, with the loaded configuration if requested
         """
         try:
-            from tools.config_manager import get_config_manager
-            
             config_manager = get_config_manager()
             
             if config_file:
-                config_path = Path(config_file)
-                if not config_path.exists():
+                if not os.path.isfile(config_file):
                     return {"success": False, "message": f"Configuration file not found: {config_file}"}
+                config_path = Path(config_file)
             else:
                 config_path = None
             
-            config = config_manager.load_config(config_path)
+            config_manager.load_config(config_path)
             
             result = {
                 "success": True,
                 "message": "Configuration loaded successfully",
-                "config_file": str(config_manager._config_file_path) if config_manager._config_file_path else None,
-                "configuration": config.dict()
+                "config_file": str(config_manager._config_file_path) if config_manager._config_file_path else None
             }
+            if include_config:
+                result["configuration"] = config_manager.get_config_dict()
             
-            logger.info(f"Configuration loaded from: {config_manager._config_file_path}")
+            logger.info("Configuration loaded from: %s", config_manager._config_file_path)
             return result
             
         except Exception as e:
@@ -551,7 +621,8 @@ def register_project_tools(mcp: FastMCP):
     def save_config_file(
         ctx: Context,
         config_data: str,
-        config_file: str = None
+        config_file: str = None,
+        checksum: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Save configuration to a file.
@@ -559,20 +630,26 @@ def register_project_tools(mcp: FastMCP):
         Args:
             config_data: JSON string containing configuration data
             config_file: Path to save configuration file (optional)
+            checksum: Checksum reported by get_config_info (optional); if config_data is that
+                      unchanged configuration, it is saved without being validated again
             
         Returns:
             Response indicating success or failure
         """
         try:
-            from tools.config_manager import get_config_manager, UnrealMCPConfig
-            
             # Parse configuration data
-            config_dict = json.loads(config_data)
-            
-            # Validate configuration
-            config = UnrealMCPConfig(**config_dict)
+            config_dict = json_loads(config_data)
             
             config_manager = get_config_manager()
+            
+            if (checksum and checksum == config_manager.get_config_checksum()
+                    and config_checksum(config_dict) == checksum):
+                # Unchanged round-trip of the current, already validated configuration
+                config = config_manager.get_config()
+            else:
+                # Validate configuration
+                config = UnrealMCPConfig(**config_dict)
+            
             save_path = Path(config_file) if config_file else None
             
             config_manager.save_config(config, save_path)
@@ -583,7 +660,7 @@ def register_project_tools(mcp: FastMCP):
                 "config_file": str(config_manager._config_file_path)
             }
             
-            logger.info(f"Configuration saved to: {config_manager._config_file_path}")
+            logger.info("Configuration saved to: %s", config_manager._config_file_path)
             return result
             
         except json.JSONDecodeError as e:
@@ -610,8 +687,6 @@ def register_project_tools(mcp: FastMCP):
             Response indicating success or failure with file path
         """
         try:
-            from tools.config_manager import get_config_manager
-            
             config_manager = get_config_manager()
             config_path = Path(config_file) if config_file else None
             
@@ -623,7 +698,7 @@ def register_project_tools(mcp: FastMCP):
                 "config_file": str(created_path)
             }
             
-            logger.info(f"Default configuration created at: {created_path}")
+            logger.info("Default configuration created at: %s", created_path)
             return result
             
         except Exception as e:
@@ -646,14 +721,12 @@ def register_project_tools(mcp: FastMCP):
             Response with validation results
         """
         try:
-            from tools.config_manager import get_config_manager
-            
             config_manager = get_config_manager()
             
             if config_file:
-                config_path = Path(config_file)
-                if not config_path.exists():
+                if not os.path.isfile(config_file):
                     return {"success": False, "message": f"Configuration file not found: {config_file}"}
+                config_path = Path(config_file)
                 config = config_manager.load_config(config_path)
             else:
                 config = config_manager.get_config()
@@ -667,7 +740,7 @@ def register_project_tools(mcp: FastMCP):
                 "message": "Configuration is valid" if len(issues) == 0 else f"Configuration has {len(issues)} issue(s)"
             }
             
-            logger.info(f"Configuration validation completed: {len(issues)} issues found")
+            logger.info("Configuration validation completed: %s issues found", len(issues))
             return result
             
         except Exception as e:
@@ -677,26 +750,30 @@ def register_project_tools(mcp: FastMCP):
     
     @mcp.tool()
     def reload_config(
-        ctx: Context
+        ctx: Context,
+        include_config: bool = False
     ) -> Dict[str, Any]:
         """
         Reload configuration from file.
         
+        Args:
+            include_config: Whether to include the reloaded configuration in the response
+            
         Returns:
-            Response indicating success or failure with reloaded configuration
+            Response indicating success or failure, with the reloaded configuration if requested
         """
         try:
-            from tools.config_manager import get_config_manager
-            
             config_manager = get_config_manager()
-            config = config_manager.reload_config()
+            config_manager.reload_config()
+            invalidate_read_cache()
             
             result = {
                 "success": True,
                 "message": "Configuration reloaded successfully",
-                "config_file": str(config_manager._config_file_path) if config_manager._config_file_path else None,
-                "configuration": config.dict()
+                "config_file": str(config_manager._config_file_path) if config_manager._config_file_path else None
             }
+            if include_config:
+                result["configuration"] = config_manager.get_config_dict()
             
             logger.info("Configuration reloaded successfully")
             return result
@@ -721,18 +798,15 @@ def register_project_tools(mcp: FastMCP):
             Response with tool configuration
         """
         try:
-            from tools.config_manager import get_config_manager
-            
             config_manager = get_config_manager()
-            tool_config = config_manager.get_tool_config(tool_name)
             
             result = {
                 "success": True,
                 "tool_name": tool_name,
-                "tool_config": tool_config.dict()
+                "tool_config": config_manager.get_tool_config_dict(tool_name)
             }
             
-            logger.info(f"Tool configuration retrieved for: {tool_name}")
+            logger.info("Tool configuration retrieved for: %s", tool_name)
             return result
             
         except Exception as e:
@@ -757,13 +831,8 @@ def register_project_tools(mcp: FastMCP):
             Response indicating success or failure
         """
         try:
-            from tools.config_manager import get_config_manager, ToolConfig
-            
-            # Parse tool configuration data
-            config_dict = json.loads(tool_config_data)
-            
-            # Validate tool configuration
-            tool_config = ToolConfig(**config_dict)
+            # Parse and validate tool configuration data in one pass
+            tool_config = ToolConfig.model_validate_json(tool_config_data)
             
             config_manager = get_config_manager()
             config_manager.update_tool_config(tool_name, tool_config)
@@ -772,14 +841,17 @@ def register_project_tools(mcp: FastMCP):
                 "success": True,
                 "message": f"Tool configuration updated successfully for: {tool_name}",
                 "tool_name": tool_name,
-                "tool_config": tool_config.dict()
+                "tool_config": tool_config.model_dump(mode="json")
             }
             
-            logger.info(f"Tool configuration updated for: {tool_name}")
+            logger.info("Tool configuration updated for: %s", tool_name)
             return result
             
-        except json.JSONDecodeError as e:
-            error_msg = f"Invalid JSON in tool configuration data: {e}"
+        except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                error_msg = f"Invalid JSON in tool configuration data: {e}"
+            else:
+                error_msg = f"Error updating tool configuration: {e}"
             logger.error(error_msg)
             return {"success": False, "message": error_msg}
         except Exception as e:
@@ -798,10 +870,12 @@ def register_project_tools(mcp: FastMCP):
             Response indicating if configuration has changed
         """
         try:
-            from tools.config_manager import get_config_manager
-            
             config_manager = get_config_manager()
+            # With watchdog installed, later checks read a flag that the watcher sets
+            watching = config_manager.start_watching(invalidate_read_cache)
             has_changed = config_manager.has_config_changed()
+            if has_changed and not watching:
+                invalidate_read_cache()
             
             result = {
                 "success": True,
@@ -810,7 +884,7 @@ def register_project_tools(mcp: FastMCP):
                 "config_file": str(config_manager._config_file_path) if config_manager._config_file_path else None
             }
             
-            logger.info(f"Configuration change check: {'changed' if has_changed else 'unchanged'}")
+            logger.info("Configuration change check: %s", 'changed' if has_changed else 'unchanged')
             return result
             
         except Exception as e:
@@ -833,45 +907,28 @@ def register_project_tools(mcp: FastMCP):
             Response with list of configuration files
         """
         try:
-            from tools.config_manager import ConfigManager
+            # ConfigManager accepts a str directory, so no Path is built here
+            config_manager = ConfigManager(config_dir) if config_dir else ConfigManager()
+            config_dir_str = os.fspath(config_manager.config_dir)
             
-            if config_dir:
-                config_manager = ConfigManager(Path(config_dir))
-            else:
-                config_manager = ConfigManager()
-            
-            config_files = []
-            config_extensions = ['.yaml', '.yml', '.json', '.toml']
-            
-            # Search in config directory
-            for file_path in config_manager.config_dir.glob("*"):
-                if file_path.is_file() and file_path.suffix.lower() in config_extensions:
-                    config_files.append({
-                        "name": file_path.name,
-                        "path": str(file_path),
-                        "size": file_path.stat().st_size,
-                        "modified": file_path.stat().st_mtime
-                    })
-            
-            # Search in current directory if different from config directory
-            if config_manager.config_dir != Path.cwd():
-                for file_path in Path.cwd().glob("*"):
-                    if file_path.is_file() and file_path.suffix.lower() in config_extensions:
-                        config_files.append({
-                            "name": file_path.name,
-                            "path": str(file_path),
-                            "size": file_path.stat().st_size,
-                            "modified": file_path.stat().st_mtime
-                        })
+            config_dir_path = os.path.realpath(config_dir_str)
+            cwd = os.path.realpath(os.getcwd())
+            
+            # Search in config directory, and in current directory if different from it
+            config_files = _list_config_files(
+                config_dir_str,
+                cwd if cwd != config_dir_path else None
+            )
             
             result = {
                 "success": True,
-                "config_dir": str(config_manager.config_dir),
-                "config_files": config_files,
+                "config_dir": config_dir_str,
+                # FastMCP would serialize tuples as arrays, so convert to objects only here
+                "config_files": [config_file._asdict() for config_file in config_files],
                 "count": len(config_files)
             }
             
-            logger.info(f"Found {len(config_files)} configuration files")
+            logger.info("Found %s configuration files", len(config_files))
             return result
             
         except Exception as e:
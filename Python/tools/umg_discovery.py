@@ -5,23 +5,435 @@ This module provides tools for discovering, inspecting, and validating UMG Widge
 Includes comprehensive widget search, component inspection, and hierarchy validation.
 """
 
+import asyncio
+import functools
 import logging
-from typing import Dict, List, Any, Optional
+import os
+import re
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from mcp.server.fastmcp import FastMCP, Context
+from tools.command_batcher import NO_RESPONSE_ERROR, get_shared_pool
 
 # Get logger
 logger = logging.getLogger("UnrealMCP")
 
+async def _send(command: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Send a command over the shared connection pool; raises on transport errors."""
+    async with get_shared_pool().acquire() as unreal:
+        return await unreal.send_command(command, params)
+
+# Inspection kinds accepted by batch_widget_inspect: kind -> (command, request fields it sends)
+WIDGET_INSPECT_KINDS = {
+    "blueprint_info": ("get_widget_blueprint_info", ("widget_name",)),
+    "components": ("list_widget_components", ("widget_name",)),
+    "hierarchy": ("validate_widget_hierarchy", ("widget_name",)),
+    "component_properties": ("get_widget_component_properties", ("widget_name", "component_name")),
+    "properties": ("list_widget_properties", ("widget_name", "component_name")),
+    "property": ("get_widget_property", ("widget_name", "component_name", "property_name")),
+    "events": ("get_available_events", ("widget_name", "component_name")),
+}
+
+# Largest number of requests batch_widget_inspect accepts in one call
+MAX_INSPECT_REQUESTS = 32
+
+# Set once the plugin answers batch_widget_inspect with "Unknown command"
+_batch_inspect_unsupported = False
+
+# Seconds a discovery response is reused, and how many responses are kept
+DISCOVERY_CACHE_TTL = 5.0
+DISCOVERY_CACHE_SIZE = 512
+
+# Speculatively fetch likely follow-up queries after search_items and list_widget_components
+PREFETCH_ENABLED = os.environ.get("UNREAL_MCP_PREFETCH", "0") == "1"
+
+# Follow-up queries queued per listing, and the most that may wait at once
+PREFETCH_LIMIT = 3
+PREFETCH_QUEUE_SIZE = 8
+
+# Sections of a get_widget_blueprint_info reply that callers can ask for individually
+WIDGET_INFO_SECTIONS = ("hierarchy", "components", "bindings", "events", "animations")
+
+# (command, sorted params) -> (monotonic timestamp, response), least recently used first
+_discovery_cache: "OrderedDict[Tuple[str, Tuple], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+# Queued prefetches as (command, params), their cache keys, and the task draining them
+_prefetch_queue: "deque[Tuple[str, Dict[str, Any]]]" = deque()
+_prefetch_keys: set = set()
+_prefetch_task: Optional[asyncio.Task] = None
+
+# Widget name -> (monotonic timestamp, component names) from its last list_widget_events reply
+_widget_components: Dict[str, Tuple[float, frozenset]] = {}
+
+# Callbacks given the widget name (None for every widget) when invalidate_widget_cache notifies
+_invalidation_hooks: List[Callable[[Optional[str]], None]] = []
+
+def _is_success(response: Optional[Dict[str, Any]]) -> bool:
+    """Whether a normalized Unreal response reports success."""
+    return bool(response) and response.get("status") != "error" and response.get("success") is not False
+
+def _cache_key(command: str, params: Dict[str, Any]) -> Tuple[str, Tuple]:
+    """Build the discovery cache key for a command."""
+    return (command, tuple(sorted(params.items())))
+
+def _fresh_response(key: Tuple[str, Tuple]) -> Optional[Dict[str, Any]]:
+    """Return the cached response for key if it is younger than DISCOVERY_CACHE_TTL."""
+    cached = _discovery_cache.get(key)
+    if cached and time.monotonic() - cached[0] < DISCOVERY_CACHE_TTL:
+        _discovery_cache.move_to_end(key)
+        return cached[1]
+    return None
+
+async def _cached_send(command: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Send a read-only discovery command, reusing a successful response younger than DISCOVERY_CACHE_TTL."""
+    key = _cache_key(command, params)
+    cached = _fresh_response(key)
+    if cached is not None:
+        logger.debug("Serving '%s' from cache", command)
+        return cached
+    
+    response = await _send(command, params)
+    _remember_response(key, response)
+    return response
+
+def _remember_response(key: Tuple[str, Tuple], response: Optional[Dict[str, Any]]):
+    """Cache a successful discovery response, evicting the least recently used beyond DISCOVERY_CACHE_SIZE."""
+    if _is_success(response):
+        _discovery_cache[key] = (time.monotonic(), response)
+        _discovery_cache.move_to_end(key)
+        if len(_discovery_cache) > DISCOVERY_CACHE_SIZE:
+            _discovery_cache.popitem(last=False)
+
+def on_widget_invalidated(hook: Callable[[Optional[str]], None]):
+    """Register a callback that drops other per-widget state whenever invalidate_widget_cache notifies."""
+    _invalidation_hooks.append(hook)
+
+def invalidate_widget_cache(widget_name: Optional[str] = None, notify: bool = True):
+    """
+    Forget cached discovery responses after a widget changed.
+    
+    Drops every response about widget_name plus all search_items results, since a new or
+    renamed asset changes them; with no widget_name the whole cache is cleared. Unless
+    notify is False (for writers that keep their own state current), the hooks registered
+    with on_widget_invalidated are called as well.
+    """
+    if notify:
+        for hook in _invalidation_hooks:
+            hook(widget_name)
+    
+    if widget_name is None:
+        _discovery_cache.clear()
+        _widget_components.clear()
+        return
+    
+    _widget_components.pop(widget_name, None)
+    stale = [
+        key for key in _discovery_cache
+        if key[0] == "search_items" or ("widget_name", widget_name) in key[1]
+    ]
+    for key in stale:
+        del _discovery_cache[key]
+
+def remember_widget_components(widget_name: str, response: Dict[str, Any]):
+    """
+    Record the component names a successful listing reply reports for a widget.
+    
+    Names are read from the reply's "components" list, including nested "children".
+    Replies without that list are ignored, so unknown_component_error stays permissive.
+    """
+    payload = response.get("result") if isinstance(response.get("result"), dict) else response
+    components = payload.get("components")
+    if not isinstance(components, list):
+        return
+    
+    names = set()
+    pending = list(components)
+    while pending:
+        item = pending.pop()
+        if isinstance(item, str):
+            names.add(item)
+        elif isinstance(item, dict):
+            name = item.get("name") or item.get("component_name")
+            if isinstance(name, str):
+                names.add(name)
+            if isinstance(item.get("children"), list):
+                pending.extend(item["children"])
+    _widget_components[widget_name] = (time.monotonic(), frozenset(names))
+
+def unknown_component_error(params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Return an error response for a command that cannot succeed, or None to send it.
+    
+    Rejects empty widget or component names, and component names missing from the
+    widget's list_widget_events reply while it is younger than DISCOVERY_CACHE_TTL.
+    """
+    widget_name = params.get("widget_name")
+    component_name = params.get("component_name")
+    if not isinstance(widget_name, str) or not widget_name.strip():
+        return {"success": False, "message": "widget_name must not be empty"}
+    if not isinstance(component_name, str) or not component_name.strip():
+        return {"success": False, "message": "component_name must not be empty"}
+    
+    known = _widget_components.get(widget_name)
+    if known and time.monotonic() - known[0] < DISCOVERY_CACHE_TTL and component_name not in known[1]:
+        return {"success": False, "message": f"Unknown component '{component_name}' in widget '{widget_name}'"}
+    return None
+
+def _select_sections(response: Dict[str, Any], sections: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Return a copy of a widget info response without the sections that were not asked for.
+    
+    Keys outside WIDGET_INFO_SECTIONS (name, path, status) are always kept. The cached
+    response itself is left untouched.
+    """
+    def trim(payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            key: value for key, value in payload.items()
+            if key not in WIDGET_INFO_SECTIONS or key in sections
+        }
+    
+    if isinstance(response.get("result"), dict):
+        return {**response, "result": trim(response["result"])}
+    return trim(response)
+
+@functools.lru_cache(maxsize=128)
+def _compile_name_pattern(pattern: str, case_sensitive: bool) -> "re.Pattern[str]":
+    """Compile a search_items name_pattern once per (pattern, case_sensitive)."""
+    return re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+
+def _update_listed(
+    response: Dict[str, Any],
+    list_keys: Tuple[str, ...],
+    update: Callable[[str, List[Any]], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Return a copy of a response with the first list found under list_keys rewritten.
+    
+    update receives the list key and items and returns the payload keys to replace. The
+    list is looked up in the response or its "result"; the cached response is left untouched.
+    """
+    nested = isinstance(response.get("result"), dict)
+    payload = response["result"] if nested else response
+    for list_key in list_keys:
+        items = payload.get(list_key)
+        if isinstance(items, list):
+            payload = {**payload, **update(list_key, items)}
+            break
+    return {**response, "result": payload} if nested else payload
+
+def _filter_listed(
+    response: Dict[str, Any],
+    list_keys: Tuple[str, ...],
+    matcher: "re.Pattern[str]"
+) -> Dict[str, Any]:
+    """Return a copy of a response keeping only the listed items whose name matches matcher."""
+    search = matcher.search
+    
+    def keep_matching(list_key: str, items: List[Any]) -> Dict[str, Any]:
+        kept = [
+            item for item in items
+            if search(item.get("name", "") if isinstance(item, dict) else str(item))
+        ]
+        return {list_key: kept, "count": len(kept)}
+    
+    return _update_listed(response, list_keys, keep_matching)
+
+def _page_listed(
+    response: Dict[str, Any],
+    list_keys: Tuple[str, ...],
+    cursor: int,
+    page_size: int
+) -> Dict[str, Any]:
+    """
+    Return a copy of a response holding one page of its listed items.
+    
+    Adds total_count and next_cursor, which is None on the last page.
+    """
+    def take_page(list_key: str, items: List[Any]) -> Dict[str, Any]:
+        end = cursor + page_size
+        return {
+            list_key: items[cursor:end],
+            "total_count": len(items),
+            "next_cursor": end if end < len(items) else None
+        }
+    
+    return _update_listed(response, list_keys, take_page)
+
+def _listed_names(response: Dict[str, Any], list_keys: Tuple[str, ...]) -> List[str]:
+    """Return the names in the first list found under list_keys in a response or its "result"."""
+    payload = response.get("result") if isinstance(response.get("result"), dict) else response
+    for list_key in list_keys:
+        items = payload.get(list_key)
+        if isinstance(items, list):
+            names = (item.get("name") if isinstance(item, dict) else item for item in items)
+            return [name for name in names if isinstance(name, str) and name]
+    return []
+
+def _prefetch(command: str, params_list: List[Dict[str, Any]]):
+    """
+    Queue likely follow-up queries so their responses are cached before they are asked for.
+    
+    A single background task sends them one at a time over the connection pool, so tool
+    calls that arrive meanwhile compete for a pooled connection with at most one prefetch.
+    Nothing is queued while PREFETCH_QUEUE_SIZE queries are already waiting.
+    """
+    global _prefetch_task
+    if not PREFETCH_ENABLED:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    
+    for params in params_list[:PREFETCH_LIMIT]:
+        if len(_prefetch_queue) >= PREFETCH_QUEUE_SIZE:
+            break
+        key = _cache_key(command, params)
+        if key in _prefetch_keys or _fresh_response(key) is not None:
+            continue
+        _prefetch_keys.add(key)
+        _prefetch_queue.append((command, params))
+    
+    if _prefetch_queue and _prefetch_task is None:
+        _prefetch_task = loop.create_task(_drain_prefetch_queue())
+
+async def _drain_prefetch_queue():
+    """Send queued prefetches oldest first until the queue is empty."""
+    global _prefetch_task
+    try:
+        while _prefetch_queue:
+            command, params = _prefetch_queue.popleft()
+            try:
+                await _cached_send(command, params)
+            except Exception as e:
+                logger.debug("Prefetch of '%s' failed: %s", command, e)
+            finally:
+                _prefetch_keys.discard(_cache_key(command, params))
+    finally:
+        _prefetch_task = None
+
+def _cancel_stale_prefetches(widget_name: Optional[str]):
+    """
+    Drop queued prefetches once a foreground call shows the caller moved on.
+    
+    If the call is about a widget none of the queued prefetches covers, the queued
+    guesses about other widgets are discarded so they stop competing for the connection.
+    A prefetch already being sent is left to finish, since the plugin cannot abort a command.
+    """
+    if not widget_name or not _prefetch_queue:
+        return
+    if any(params.get("widget_name") == widget_name for _, params in _prefetch_queue):
+        return
+    
+    logger.debug("Dropping %d queued prefetches after a call about '%s'", len(_prefetch_queue), widget_name)
+    for command, params in _prefetch_queue:
+        _prefetch_keys.discard(_cache_key(command, params))
+    _prefetch_queue.clear()
+
+def _prefetch_top_widgets(params: Dict[str, Any], response: Dict[str, Any]):
+    """The top widget hits of a search are usually inspected next."""
+    if params["asset_type"] == "Widget":
+        _prefetch("get_widget_blueprint_info", [
+            {"widget_name": name} for name in _listed_names(response, ("assets", "items", "results"))[:PREFETCH_LIMIT]
+        ])
+
+def _prefetch_listed_components(params: Dict[str, Any], response: Dict[str, Any]):
+    """Listed components usually have their properties read next."""
+    _prefetch("get_widget_component_properties", [
+        {"widget_name": params["widget_name"], "component_name": name}
+        for name in _listed_names(response, ("components", "children"))[:PREFETCH_LIMIT]
+    ])
+
+async def _run_tool(
+    command: str,
+    params: Dict[str, Any],
+    action: str,
+    follow_up: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """
+    Send one discovery command and shape the reply the way every discovery tool does.
+    
+    Args:
+        command: Plugin command to send
+        params: Command parameters
+        action: Phrase used in log and error messages (e.g. "listing widget components")
+        follow_up: Optional hook called with (params, response) after a successful reply
+    """
+    _cancel_stale_prefetches(params.get("widget_name"))
+    logger.info("%s with params: %s", action.capitalize(), params)
+    try:
+        response = await _cached_send(command, params)
+    except Exception as e:
+        error_msg = f"Error {action}: {e}"
+        logger.error(error_msg)
+        return {"success": False, "message": error_msg}
+    
+    if not response:
+        logger.error("No response from Unreal Engine")
+        return NO_RESPONSE_ERROR
+    
+    logger.debug("%s response: %s", command, response)
+    
+    if follow_up and _is_success(response):
+        follow_up(params, response)
+    return response
+
+async def _inspect_individually(requests: List[Dict[str, Any]], dedupe: bool) -> Dict[str, Any]:
+    """
+    Answer a batch_widget_inspect call with the per-kind discovery commands.
+    
+    Used when the plugin has no batch_widget_inspect handler. Sub-queries with a fresh
+    discovery cache entry are answered from it; the rest share one "batch" round trip
+    (or go out one by one if the plugin lacks "batch") and fill the cache. Identical
+    sub-queries are sent once when dedupe is set.
+    """
+    calls: List[Tuple[str, Dict[str, Any]]] = []
+    call_index: Dict[Tuple[str, Tuple], int] = {}
+    slots = []
+    for index, request in enumerate(requests):
+        for kind in request["kinds"]:
+            command, fields = WIDGET_INSPECT_KINDS[kind]
+            params = {field: request[field] for field in fields}
+            key = (command, tuple(params.items()))
+            if not dedupe or key not in call_index:
+                call_index[key] = len(calls)
+                calls.append((command, params))
+            slots.append((index, kind, call_index[key] if dedupe else len(calls) - 1))
+    
+    responses: List[Optional[Dict[str, Any]]] = [_fresh_response(_cache_key(command, params)) for command, params in calls]
+    misses = [call for call, response in enumerate(responses) if response is None]
+    if misses:
+        async with get_shared_pool().acquire() as unreal:
+            fetched = await unreal.send_batch([calls[call] for call in misses])
+        for call, response in zip(misses, fetched):
+            if response is None:
+                response = {"status": "error", "error": "Failed to connect to Unreal Engine"}
+            _remember_response(_cache_key(*calls[call]), response)
+            responses[call] = response
+    
+    results = []
+    for index, kind, call in slots:
+        response = responses[call]
+        results.append({
+            "index": index,
+            "kind": kind,
+            "success": bool(response) and response.get("status") != "error" and response.get("success") is not False,
+            "data": response
+        })
+    return {"success": True, "results": results}
+
 def register_umg_discovery_tools(mcp: FastMCP):
     """Register UMG discovery tools with the MCP server."""
 
     @mcp.tool()
-    def search_items(
+    async def search_items(
         ctx: Context,
         search_term: str = "",
         asset_type: str = "Widget",
         path: str = "/Game",
-        case_sensitive: bool = False
+        case_sensitive: bool = False,
+        name_pattern: str = ""
     ) -> Dict[str, Any]:
         """
         Search for assets in the Unreal Engine project.
@@ -33,45 +445,40 @@ def register_umg_discovery_tools(mcp: FastMCP):
             search_term: Text to search for (empty string returns all assets of type)
             asset_type: Type of asset to search for (Widget, Blueprint, Material, etc.)
             path: Content browser path to search within (default: /Game)
-            case_sensitive: Whether search should be case sensitive
+            case_sensitive: Whether search should be case sensitive (also applies to name_pattern)
+            name_pattern: Optional regular expression the asset names must also match
             
         Returns:
             Dict containing array of matching assets with name, path, and type information
         """
-        from unreal_mcp_server import get_unreal_connection
+        matcher = None
+        if name_pattern:
+            try:
+                matcher = _compile_name_pattern(name_pattern, case_sensitive)
+            except re.error as e:
+                return {"success": False, "message": f"Invalid name_pattern: {e}"}
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {
-                "search_term": search_term,
-                "asset_type": asset_type,
-                "path": path,
-                "case_sensitive": case_sensitive
-            }
-            
-            logger.info(f"Searching for assets with params: {params}")
-            response = unreal.send_command("search_items", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Asset search response: {response}")
-            return response or {}
-            
-        except Exception as e:
-            error_msg = f"Error searching assets: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        params = {
+            "search_term": search_term,
+            "asset_type": asset_type,
+            "path": path,
+            "case_sensitive": case_sensitive
+        }
+        if not matcher:
+            return await _run_tool("search_items", params, "searching assets", follow_up=_prefetch_top_widgets)
+        
+        # Filter first so prefetch warms the widgets that are actually returned
+        response = await _run_tool("search_items", params, "searching assets")
+        if _is_success(response):
+            response = _filter_listed(response, ("assets", "items", "results"), matcher)
+            _prefetch_top_widgets(params, response)
+        return response
 
     @mcp.tool()
-    def get_widget_blueprint_info(
+    async def get_widget_blueprint_info(
         ctx: Context,
-        widget_name: str
+        widget_name: str,
+        sections: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Get comprehensive information about a Widget Blueprint.
@@ -85,39 +492,31 @@ def register_umg_discovery_tools(mcp: FastMCP):
         
         Args:
             widget_name: Name of the widget blueprint to inspect
+            sections: Only return these sections (hierarchy, components, bindings, events,
+                animations); all sections are returned when omitted
             
         Returns:
             Dict containing complete widget structure and metadata
         """
-        from unreal_mcp_server import get_unreal_connection
+        params: Dict[str, Any] = {"widget_name": widget_name}
+        if sections:
+            unknown = [section for section in sections if section not in WIDGET_INFO_SECTIONS]
+            if unknown:
+                return {"success": False, "message": f"Unknown sections {unknown}; expected any of {list(WIDGET_INFO_SECTIONS)}"}
+            # Sorted tuple keeps the cache key hashable and order-independent
+            params["sections"] = tuple(sorted(set(sections)))
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {"widget_name": widget_name}
-            
-            logger.info(f"Getting widget blueprint info for: {widget_name}")
-            response = unreal.send_command("get_widget_blueprint_info", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Widget blueprint info response: {response}")
-            return response or {}
-            
-        except Exception as e:
-            error_msg = f"Error getting widget blueprint info: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        response = await _run_tool("get_widget_blueprint_info", params, "getting widget blueprint info")
+        if sections and _is_success(response):
+            return _select_sections(response, params["sections"])
+        return response
 
     @mcp.tool()
-    def list_widget_components(
+    async def list_widget_components(
         ctx: Context,
-        widget_name: str
+        widget_name: str,
+        page_size: int = 0,
+        cursor: int = 0
     ) -> Dict[str, Any]:
         """
         List all components in a Widget Blueprint with their hierarchy and properties.
@@ -127,37 +526,29 @@ def register_umg_discovery_tools(mcp: FastMCP):
         
         Args:
             widget_name: Name of the widget blueprint to inspect
+            page_size: Return at most this many components per call (0 returns them all)
+            cursor: Index of the first component to return; pass the previous reply's next_cursor
             
         Returns:
-            Dict containing component hierarchy with names, types, and relationships
+            Dict containing component hierarchy with names, types, and relationships; paged
+            replies also carry total_count and next_cursor (None on the last page)
         """
-        from unreal_mcp_server import get_unreal_connection
+        if page_size < 0 or cursor < 0:
+            return {"success": False, "message": "page_size and cursor must not be negative"}
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {"widget_name": widget_name}
-            
-            logger.info(f"Listing widget components for: {widget_name}")
-            response = unreal.send_command("list_widget_components", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Widget components response: {response}")
-            return response or {}
-            
-        except Exception as e:
-            error_msg = f"Error listing widget components: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        params = {"widget_name": widget_name}
+        if not page_size:
+            return await _run_tool("list_widget_components", params, "listing widget components", follow_up=_prefetch_listed_components)
+        
+        # The full list stays cached, so later pages are sliced without another round trip
+        response = await _run_tool("list_widget_components", params, "listing widget components")
+        if _is_success(response):
+            response = _page_listed(response, ("components", "children"), cursor, page_size)
+            _prefetch_listed_components(params, response)
+        return response
 
     @mcp.tool()
-    def validate_widget_hierarchy(
+    async def validate_widget_hierarchy(
         ctx: Context,
         widget_name: str
     ) -> Dict[str, Any]:
@@ -177,33 +568,11 @@ def register_umg_discovery_tools(mcp: FastMCP):
         Returns:
             Dict containing validation results with warnings and recommendations
         """
-        from unreal_mcp_server import get_unreal_connection
-        
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {"widget_name": widget_name}
-            
-            logger.info(f"Validating widget hierarchy for: {widget_name}")
-            response = unreal.send_command("validate_widget_hierarchy", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Widget hierarchy validation response: {response}")
-            return response or {}
-            
-        except Exception as e:
-            error_msg = f"Error validating widget hierarchy: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        params = {"widget_name": widget_name}
+        return await _run_tool("validate_widget_hierarchy", params, "validating widget hierarchy")
 
     @mcp.tool()
-    def get_widget_component_properties(
+    async def get_widget_component_properties(
         ctx: Context,
         widget_name: str,
         component_name: str
@@ -225,36 +594,14 @@ def register_umg_discovery_tools(mcp: FastMCP):
         Returns:
             Dict containing all component properties with values and metadata
         """
-        from unreal_mcp_server import get_unreal_connection
-        
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {
-                "widget_name": widget_name,
-                "component_name": component_name
-            }
-            
-            logger.info(f"Getting component properties for {component_name} in {widget_name}")
-            response = unreal.send_command("get_widget_component_properties", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Component properties response: {response}")
-            return response or {}
-            
-        except Exception as e:
-            error_msg = f"Error getting component properties: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        params = {
+            "widget_name": widget_name,
+            "component_name": component_name
+        }
+        return await _run_tool("get_widget_component_properties", params, "getting component properties")
 
     @mcp.tool()
-    def list_widget_properties(
+    async def list_widget_properties(
         ctx: Context,
         widget_name: str,
         component_name: str,
@@ -280,38 +627,16 @@ def register_umg_discovery_tools(mcp: FastMCP):
         Returns:
             Dict containing property list with metadata and categories
         """
-        from unreal_mcp_server import get_unreal_connection
-        
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {
-                "widget_name": widget_name,
-                "component_name": component_name,
-                "include_inherited": include_inherited,
-                "category_filter": category_filter
-            }
-            
-            logger.info(f"Listing widget properties for {component_name} in {widget_name}")
-            response = unreal.send_command("list_widget_properties", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Widget properties response: {response}")
-            return response or {}
-            
-        except Exception as e:
-            error_msg = f"Error listing widget properties: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        params = {
+            "widget_name": widget_name,
+            "component_name": component_name,
+            "include_inherited": include_inherited,
+            "category_filter": category_filter
+        }
+        return await _run_tool("list_widget_properties", params, "listing widget properties")
 
     @mcp.tool()
-    def get_widget_property(
+    async def get_widget_property(
         ctx: Context,
         widget_name: str,
         component_name: str,
@@ -328,37 +653,15 @@ def register_umg_discovery_tools(mcp: FastMCP):
         Returns:
             Dict containing the current property value and metadata
         """
-        from unreal_mcp_server import get_unreal_connection
-        
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {
-                "widget_name": widget_name,
-                "component_name": component_name,
-                "property_name": property_name
-            }
-            
-            logger.info(f"Getting widget property {property_name} for {component_name} in {widget_name}")
-            response = unreal.send_command("get_widget_property", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Widget property response: {response}")
-            return response or {}
-            
-        except Exception as e:
-            error_msg = f"Error getting widget property: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        params = {
+            "widget_name": widget_name,
+            "component_name": component_name,
+            "property_name": property_name
+        }
+        return await _run_tool("get_widget_property", params, "getting widget property")
 
     @mcp.tool()
-    def get_available_events(
+    async def get_available_events(
         ctx: Context,
         widget_name: str,
         component_name: str
@@ -379,30 +682,71 @@ def register_umg_discovery_tools(mcp: FastMCP):
         Returns:
             Dict containing list of available events with binding information
         """
-        from unreal_mcp_server import get_unreal_connection
+        params = {
+            "widget_name": widget_name,
+            "component_name": component_name
+        }
+        return await _run_tool("get_available_events", params, "getting available events")
+
+    @mcp.tool()
+    async def batch_widget_inspect(
+        ctx: Context,
+        requests: List[Dict[str, Any]],
+        dedupe: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Run several widget inspections in one round trip to Unreal Engine.
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {
-                "widget_name": widget_name,
-                "component_name": component_name
-            }
+        Each request names a widget and the kinds of information wanted:
+        - "blueprint_info", "components", "hierarchy": need widget_name
+        - "component_properties", "properties", "events": also need component_name
+        - "property": also needs component_name and property_name
+        
+        Args:
+            requests: Up to 32 requests like
+                      {"widget_name": "WBP_Menu", "component_name": "PlayButton", "kinds": ["events"]}
+            dedupe: Whether identical sub-queries across requests are answered once
             
-            logger.info(f"Getting available events for {component_name} in {widget_name}")
-            response = unreal.send_command("get_available_events", params)
+        Returns:
+            Dict containing "results": one {index, kind, success, data} entry per requested kind
+        """
+        global _batch_inspect_unsupported
+        try:
+            if not requests:
+                return {"success": False, "message": "requests must contain at least one request"}
+            if len(requests) > MAX_INSPECT_REQUESTS:
+                return {"success": False, "message": f"At most {MAX_INSPECT_REQUESTS} requests are allowed, got {len(requests)}"}
+            
+            for index, request in enumerate(requests):
+                kinds = request.get("kinds")
+                if not kinds:
+                    return {"success": False, "message": f"Request {index} has no kinds"}
+                for kind in kinds:
+                    if kind not in WIDGET_INSPECT_KINDS:
+                        return {"success": False, "message": f"Request {index} has unknown kind '{kind}'; expected one of {sorted(WIDGET_INSPECT_KINDS)}"}
+                    missing = [field for field in WIDGET_INSPECT_KINDS[kind][1] if not request.get(field)]
+                    if missing:
+                        return {"success": False, "message": f"Request {index} kind '{kind}' needs {', '.join(missing)}"}
+            
+            logger.info("Inspecting widgets with %s batched requests", len(requests))
+            response = None
+            if not _batch_inspect_unsupported:
+                response = await _send("batch_widget_inspect", {"requests": requests, "dedupe": dedupe})
+                if response and str(response.get("error", "")).startswith("Unknown command"):
+                    logger.info("Unreal does not support 'batch_widget_inspect'; sending inspections individually")
+                    _batch_inspect_unsupported = True
+            
+            if _batch_inspect_unsupported:
+                response = await _inspect_individually(requests, dedupe)
             
             if not response:
                 logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
+                return NO_RESPONSE_ERROR
             
-            logger.info(f"Available events response: {response}")
-            return response or {}
+            logger.debug("Batch widget inspect response: %s", response)
+            return response
             
         except Exception as e:
-            error_msg = f"Error getting available events: {e}"
+            error_msg = f"Error inspecting widgets: {e}"
             logger.error(error_msg)
             return {"success": False, "message": error_msg}
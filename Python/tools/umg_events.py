@@ -5,17 +5,121 @@ This module provides comprehensive event binding and interaction capabilities fo
 Includes input events, custom events, delegates, and animation triggers.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Awaitable, Callable, Dict, List, Any, Optional
 from mcp.server.fastmcp import FastMCP, Context
+from tools.command_batcher import CommandBatcher, collect_operations, get_shared_pool, start_tool_operation, unreal_tool
+from tools.umg_discovery import invalidate_widget_cache, remember_widget_components, unknown_component_error
 
 # Get logger
 logger = logging.getLogger("UnrealMCP")
 
+# Response of get_event_guide, shared across calls; never mutate it
+EVENT_GUIDE = {
+    "success": True,
+    "event_guide": {
+        "input_events": {
+            "button": ("OnClicked", "OnHovered", "OnPressed", "OnReleased"),
+            "text_input": ("OnTextChanged", "OnTextCommitted", "OnFocusReceived", "OnFocusLost"),
+            "slider": ("OnValueChanged", "OnMouseCaptureBegin", "OnMouseCaptureEnd"),
+            "checkbox": ("OnCheckStateChanged",)
+        },
+        "custom_events": {
+            "purpose": "Define your own events for widget communication",
+            "parameters": "Can accept parameters like functions",
+            "usage": "Call from Blueprint graphs or external code"
+        },
+        "delegates": {
+            "purpose": "Allow multiple functions to respond to one event",
+            "types": ("Single-cast", "Multi-cast"),
+            "binding": "Can bind/unbind functions dynamically"
+        },
+        "best_practices": (
+            "Use descriptive event and function names",
+            "Keep event handling functions simple and focused",
+            "Use custom events for widget-to-widget communication",
+            "Test event handling thoroughly with user interactions",
+            "Document event parameters and expected behavior"
+        ),
+        "common_patterns": (
+            "Button click handlers for navigation",
+            "Text input validation events",
+            "Slider value change callbacks",
+            "Animation completion triggers"
+        )
+    }
+}
+
+# Set once the plugin answers bind_delegate_events with "Unknown command"
+_delegate_bulk_unsupported = False
+
+# Shared batcher for the event write tools; each write drops the widget's cached discovery data
+_batcher = CommandBatcher(on_complete=lambda params: invalidate_widget_cache(params.get("widget_name")))
+
+async def _query(command: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Send a read-only event query over a persistent pooled connection."""
+    async with get_shared_pool().acquire() as unreal:
+        return await unreal.send_command(command, params)
+
+async def _list_events(command: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Query a widget's events and remember its component names for unknown_component_error."""
+    response = await _query(command, params)
+    if response and response.get("status") != "error" and response.get("success") is not False:
+        remember_widget_components(params["widget_name"], response)
+    return response
+
+def _component_checked(send: Callable[[str, Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]):
+    """Wrap a send function so commands naming an unknown component fail without a round trip."""
+    async def checked(command: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return unknown_component_error(params) or await send(command, params)
+    return checked
+
+async def _send_input_events(command: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Submit bind_input_events through the batcher, skipping the round trip for an empty mapping."""
+    if not params["input_events"]:
+        return {"success": True, "message": "No input events to bind"}
+    return await _batcher.submit(command, params)
+
+async def _send_delegates(command: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Bind several delegates of one component with a single bind_delegate_events command.
+    
+    An empty mapping needs no round trip and a single entry goes out as a plain
+    bind_delegate_event so it can share the batcher's batches. If the plugin does not
+    know the bulk command (remembered for later calls), each delegate is submitted as a
+    bind_delegate_event call instead and the individual responses are returned as "results".
+    """
+    global _delegate_bulk_unsupported
+    delegates = params.pop("delegates")
+    if not delegates:
+        return {"success": True, "message": "No delegates to bind"}
+    
+    if len(delegates) == 1:
+        (delegate_name, target_function), = delegates.items()
+        return await _batcher.submit("bind_delegate_event", dict(params, delegate_name=delegate_name, target_function=target_function))
+    
+    if not _delegate_bulk_unsupported:
+        response = await _batcher.submit(command, dict(params, delegates=delegates))
+        if not (response and str(response.get("error", "")).startswith("Unknown command")):
+            return response
+        logger.info("Unreal does not support '%s'; binding delegates individually", command)
+        _delegate_bulk_unsupported = True
+    
+    results = await asyncio.gather(*(
+        _batcher.submit("bind_delegate_event", dict(params, delegate_name=delegate_name, target_function=target_function))
+        for delegate_name, target_function in delegates.items()
+    ))
+    return {
+        "success": all(bool(result) and result.get("status") != "error" and result.get("success") is not False for result in results),
+        "results": results
+    }
+
 def register_umg_event_tools(mcp: FastMCP):
     """Register UMG event tools with the MCP server."""
 
     @mcp.tool()
+    @unreal_tool("bind_input_events", "binding input events", _component_checked(_send_input_events))
     def bind_input_events(
         ctx: Context,
         widget_name: str,
@@ -43,36 +147,16 @@ def register_umg_event_tools(mcp: FastMCP):
         Returns:
             Dict containing event binding confirmation and details
         """
-        from unreal_mcp_server import get_unreal_connection
+        logger.info("Binding input events for %s in %s", component_name, widget_name)
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {
-                "widget_name": widget_name,
-                "component_name": component_name,
-                "input_events": input_events
-            }
-            
-            logger.info(f"Binding input events for {component_name} in {widget_name}")
-            response = unreal.send_command("bind_input_events", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Input events binding response: {response}")
-            return response or {}
-            
-        except Exception as e:
-            error_msg = f"Error binding input events: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        return {
+            "widget_name": widget_name,
+            "component_name": component_name,
+            "input_events": input_events
+        }
 
     @mcp.tool()
+    @unreal_tool("create_custom_event", "creating custom event", _batcher.submit)
     def create_custom_event(
         ctx: Context,
         widget_name: str,
@@ -93,36 +177,16 @@ def register_umg_event_tools(mcp: FastMCP):
         Returns:
             Dict containing custom event creation confirmation
         """
-        from unreal_mcp_server import get_unreal_connection
+        logger.info("Creating custom event %s in %s", event_name, widget_name)
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {
-                "widget_name": widget_name,
-                "event_name": event_name,
-                "event_parameters": event_parameters or []
-            }
-            
-            logger.info(f"Creating custom event {event_name} in {widget_name}")
-            response = unreal.send_command("create_custom_event", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Custom event creation response: {response}")
-            return response or {}
-            
-        except Exception as e:
-            error_msg = f"Error creating custom event: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        return {
+            "widget_name": widget_name,
+            "event_name": event_name,
+            "event_parameters": event_parameters or []
+        }
 
     @mcp.tool()
+    @unreal_tool("bind_delegate_event", "binding delegate event", _component_checked(_batcher.submit))
     def bind_delegate_event(
         ctx: Context,
         widget_name: str,
@@ -145,37 +209,50 @@ def register_umg_event_tools(mcp: FastMCP):
         Returns:
             Dict containing delegate binding confirmation
         """
-        from unreal_mcp_server import get_unreal_connection
+        logger.info("Binding delegate %s to %s in %s", delegate_name, target_function, widget_name)
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {
-                "widget_name": widget_name,
-                "component_name": component_name,
-                "delegate_name": delegate_name,
-                "target_function": target_function
-            }
-            
-            logger.info(f"Binding delegate {delegate_name} to {target_function} in {widget_name}")
-            response = unreal.send_command("bind_delegate_event", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Delegate binding response: {response}")
-            return response or {}
+        return {
+            "widget_name": widget_name,
+            "component_name": component_name,
+            "delegate_name": delegate_name,
+            "target_function": target_function
+        }
+
+    @mcp.tool()
+    @unreal_tool("bind_delegate_events", "binding delegate events", _component_checked(_send_delegates))
+    def bind_delegate_events(
+        ctx: Context,
+        widget_name: str,
+        component_name: str,
+        delegates: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """
+        Bind several delegates of one component to target functions in a single call.
+        
+        Example delegates:
+        {
+            "OnValueChanged": "HandleValueChanged",
+            "OnMouseCaptureEnd": "HandleCaptureEnd"
+        }
+        
+        Args:
+            widget_name: Name of the widget blueprint
+            component_name: Name of the component containing the delegates
+            delegates: Dictionary mapping delegate names to target function names
             
-        except Exception as e:
-            error_msg = f"Error binding delegate event: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        Returns:
+            Dict containing delegate binding confirmation, or per-delegate "results"
+        """
+        logger.info("Binding %s delegates on %s in %s", len(delegates), component_name, widget_name)
+        
+        return {
+            "widget_name": widget_name,
+            "component_name": component_name,
+            "delegates": delegates
+        }
 
     @mcp.tool()
+    @unreal_tool("create_animation_event", "creating animation event", _batcher.submit)
     def create_animation_event(
         ctx: Context,
         widget_name: str,
@@ -198,37 +275,17 @@ def register_umg_event_tools(mcp: FastMCP):
         Returns:
             Dict containing animation event creation confirmation
         """
-        from unreal_mcp_server import get_unreal_connection
+        logger.info("Creating animation event %s at %ss in %s", event_name, trigger_time, widget_name)
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {
-                "widget_name": widget_name,
-                "animation_name": animation_name,
-                "event_name": event_name,
-                "trigger_time": trigger_time
-            }
-            
-            logger.info(f"Creating animation event {event_name} at {trigger_time}s in {widget_name}")
-            response = unreal.send_command("create_animation_event", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Animation event creation response: {response}")
-            return response or {}
-            
-        except Exception as e:
-            error_msg = f"Error creating animation event: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        return {
+            "widget_name": widget_name,
+            "animation_name": animation_name,
+            "event_name": event_name,
+            "trigger_time": trigger_time
+        }
 
     @mcp.tool()
+    @unreal_tool("list_widget_events", "listing widget events", _list_events)
     def list_widget_events(
         ctx: Context,
         widget_name: str
@@ -248,32 +305,12 @@ def register_umg_event_tools(mcp: FastMCP):
         Returns:
             Dict containing comprehensive list of all widget events
         """
-        from unreal_mcp_server import get_unreal_connection
+        logger.info("Listing events for widget: %s", widget_name)
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {"widget_name": widget_name}
-            
-            logger.info(f"Listing events for widget: {widget_name}")
-            response = unreal.send_command("list_widget_events", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Widget events response: {response}")
-            return response or {}
-            
-        except Exception as e:
-            error_msg = f"Error listing widget events: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        return {"widget_name": widget_name}
 
     @mcp.tool()
+    @unreal_tool("get_event_bindings", "getting event bindings", _component_checked(_query))
     def get_event_bindings(
         ctx: Context,
         widget_name: str,
@@ -291,35 +328,15 @@ def register_umg_event_tools(mcp: FastMCP):
         Returns:
             Dict containing event binding information
         """
-        from unreal_mcp_server import get_unreal_connection
+        logger.info("Getting event bindings for %s in %s", component_name, widget_name)
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {
-                "widget_name": widget_name,
-                "component_name": component_name
-            }
-            
-            logger.info(f"Getting event bindings for {component_name} in {widget_name}")
-            response = unreal.send_command("get_event_bindings", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Event bindings response: {response}")
-            return response or {}
-            
-        except Exception as e:
-            error_msg = f"Error getting event bindings: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        return {
+            "widget_name": widget_name,
+            "component_name": component_name
+        }
 
     @mcp.tool()
+    @unreal_tool("remove_event_binding", "removing event binding", _component_checked(_batcher.submit))
     def remove_event_binding(
         ctx: Context,
         widget_name: str,
@@ -337,34 +354,66 @@ def register_umg_event_tools(mcp: FastMCP):
         Returns:
             Dict containing event removal confirmation
         """
-        from unreal_mcp_server import get_unreal_connection
+        logger.info("Removing event binding %s from %s in %s", event_name, component_name, widget_name)
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {
-                "widget_name": widget_name,
-                "component_name": component_name,
-                "event_name": event_name
-            }
-            
-            logger.info(f"Removing event binding {event_name} from {component_name} in {widget_name}")
-            response = unreal.send_command("remove_event_binding", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
+        return {
+            "widget_name": widget_name,
+            "component_name": component_name,
+            "event_name": event_name
+        }
+
+    # Event write tools that queue_event_operation can start, by name
+    queueable_tools = {tool.__name__: tool for tool in (
+        bind_input_events, create_custom_event, bind_delegate_event, create_animation_event, remove_event_binding
+    )}
+
+    @mcp.tool()
+    def queue_event_operation(
+        ctx: Context,
+        operation: str,
+        params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Start an event write without waiting for Unreal Engine to answer.
+        
+        Queue several independent operations, then fetch all their results with one
+        await_operations call; operations queued together share batched round trips.
+        The params are checked and sent exactly as the matching tool would.
+        
+        Args:
+            operation: One of bind_input_events, create_custom_event, bind_delegate_event,
+                       create_animation_event, remove_event_binding
+            params: The parameters the matching tool takes, e.g.
+                    {"widget_name": "WBP_Menu", "event_name": "OnOpened"}
             
-            logger.info(f"Event binding removal response: {response}")
-            return response or {}
+        Returns:
+            Dict containing the operation_id to pass to await_operations
+        """
+        if operation not in queueable_tools:
+            return {"success": False, "message": f"Unknown operation '{operation}'; expected one of {list(queueable_tools)}"}
+        return start_tool_operation(queueable_tools[operation], ctx, params)
+
+    @mcp.tool()
+    async def await_operations(
+        ctx: Context,
+        operation_ids: List[str],
+        timeout: float = 10.0
+    ) -> Dict[str, Any]:
+        """
+        Wait for queued operations and return their responses.
+        
+        Works for ids from queue_event_operation and queue_reflection_operation. Operations
+        that have not finished within timeout are reported as pending and can be awaited again.
+        
+        Args:
+            operation_ids: Ids returned by the queue tools
+            timeout: Seconds to wait for the operations to finish
             
-        except Exception as e:
-            error_msg = f"Error removing event binding: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        Returns:
+            Dict containing "results": the response of each operation by id
+        """
+        results = await collect_operations(operation_ids, max(0.0, timeout))
+        return {"success": True, "results": results}
 
     @mcp.tool()
     def get_event_guide() -> Dict[str, Any]:
@@ -374,37 +423,4 @@ def register_umg_event_tools(mcp: FastMCP):
         Returns:
             Dict containing event system guide with examples and patterns
         """
-        return {
-            "success": True,
-            "event_guide": {
-                "input_events": {
-                    "button": ["OnClicked", "OnHovered", "OnPressed", "OnReleased"],
-                    "text_input": ["OnTextChanged", "OnTextCommitted", "OnFocusReceived", "OnFocusLost"],
-                    "slider": ["OnValueChanged", "OnMouseCaptureBegin", "OnMouseCaptureEnd"],
-                    "checkbox": ["OnCheckStateChanged"]
-                },
-                "custom_events": {
-                    "purpose": "Define your own events for widget communication",
-                    "parameters": "Can accept parameters like functions",
-                    "usage": "Call from Blueprint graphs or external code"
-                },
-                "delegates": {
-                    "purpose": "Allow multiple functions to respond to one event",
-                    "types": ["Single-cast", "Multi-cast"],
-                    "binding": "Can bind/unbind functions dynamically"
-                },
-                "best_practices": [
-                    "Use descriptive event and function names",
-                    "Keep event handling functions simple and focused",
-                    "Use custom events for widget-to-widget communication",
-                    "Test event handling thoroughly with user interactions",
-                    "Document event parameters and expected behavior"
-                ],
-                "common_patterns": [
-                    "Button click handlers for navigation",
-                    "Text input validation events",
-                    "Slider value change callbacks",
-                    "Animation completion triggers"
-                ]
-            }
-        }
+        return EVENT_GUIDE
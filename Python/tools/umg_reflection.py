@@ -6,16 +6,211 @@ reflection system. Enables generic widget creation and advanced property manipul
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+import time
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
 from mcp.server.fastmcp import FastMCP, Context
+from tools.command_batcher import CommandBatcher, get_shared_pool, start_tool_operation, unreal_tool
+from tools.umg_discovery import invalidate_widget_cache, on_widget_invalidated, unknown_component_error
 
 # Get logger
 logger = logging.getLogger("UnrealMCP")
 
+# Response of get_reflection_guide, shared across calls; never mutate it
+REFLECTION_GUIDE = {
+    "success": True,
+    "reflection_guide": {
+        "purpose": "Use Unreal's reflection system for generic widget creation and manipulation",
+        "advantages": (
+            "Access to all UMG widget types",
+            "Generic property setting without specific tool methods",
+            "Future-proof against Unreal Engine updates",
+            "Consistent with Unreal's internal widget creation patterns"
+        ),
+        "common_widget_types": {
+            "layout": ("CanvasPanel", "VerticalBox", "HorizontalBox", "GridPanel", "ScrollBox"),
+            "controls": ("Button", "CheckBox", "Slider", "ProgressBar", "EditableText"),
+            "display": ("TextBlock", "RichTextBlock", "Image", "Border", "Spacer"),
+            "input": ("EditableTextBox", "MultiLineEditableTextBox", "ComboBox", "ListBox")
+        },
+        "best_practices": (
+            "Use get_available_widget_types() to discover new widget types",
+            "Check widget type info before creating complex widgets",
+            "Use reflection for widgets not covered by specific tools",
+            "Test reflection-created widgets thoroughly",
+            "Document custom widget creation patterns"
+        ),
+        "workflow_examples": {
+            "discover_widgets": (
+                "1. Call get_available_widget_types()",
+                "2. Browse widget categories",
+                "3. Get detailed info with get_widget_type_info()"
+            ),
+            "create_custom_widget": (
+                "1. Use create_widget_via_reflection()",
+                "2. Set properties with set_widget_property_via_reflection()",
+                "3. Test and validate the widget"
+            )
+        }
+    }
+}
+
+# Seconds widget type and palette queries are served from memory; they only change when the
+# editor loads new modules, so invalidate_reflection_cache forces a refresh sooner
+REFLECTION_CACHE_TTL = 30.0
+
+# Most reflection query responses kept
+REFLECTION_CACHE_SIZE = 512
+
+# (command, params) -> (monotonic timestamp, response) of successful reflection queries,
+# least recently used first
+_reflection_cache: "OrderedDict[Tuple[str, frozenset], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+async def _cached_read(command: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Send a read-only reflection query, reusing a successful response younger than REFLECTION_CACHE_TTL."""
+    key = (command, frozenset(params.items()))
+    cached = _reflection_cache.get(key)
+    if cached:
+        if time.monotonic() - cached[0] < REFLECTION_CACHE_TTL:
+            _reflection_cache.move_to_end(key)
+            logger.debug("Serving '%s' from cache", command)
+            return cached[1]
+        del _reflection_cache[key]
+    
+    async with get_shared_pool().acquire() as unreal:
+        response = await unreal.send_command(command, params)
+    
+    if response and response.get("status") != "error" and response.get("success") is not False:
+        _reflection_cache[key] = (time.monotonic(), response)
+        _reflection_cache.move_to_end(key)
+        if len(_reflection_cache) > REFLECTION_CACHE_SIZE:
+            _reflection_cache.popitem(last=False)
+    return response
+
+# Most plugin-side property handles remembered by set_widget_property_via_reflection
+PROPERTY_HANDLE_CACHE_SIZE = 256
+
+# Property handles by (widget_name, component_name, property_name), least recently used first
+_property_handles: "OrderedDict[Tuple[str, str, str], Any]" = OrderedDict()
+
+# Set once the plugin answers resolve_widget_property with "Unknown command"
+_property_handles_unsupported = False
+
+# Most property values remembered for skipping writes that would change nothing
+PROPERTY_VALUE_CACHE_SIZE = 1024
+
+# Last successfully written (property_type, property_value) by (widget_name, component_name,
+# property_name), least recently used first
+_last_property_values: "OrderedDict[Tuple[str, str, str], Tuple[str, Any]]" = OrderedDict()
+
+# Shared batcher for the reflection write tools; each write drops the widget's cached discovery
+# data, while the remembered property values are kept current by the writes themselves
+_batcher = CommandBatcher(on_complete=lambda params: invalidate_widget_cache(params.get("widget_name"), notify=False))
+
+def _forget_property_values(widget_name: Optional[str]):
+    """Forget the remembered property values of a widget (all widgets for None), so its next writes are always sent."""
+    if widget_name is None:
+        _last_property_values.clear()
+        return
+    for key in [key for key in _last_property_values if key[0] == widget_name]:
+        del _last_property_values[key]
+
+# Other tools' writes (added or removed components, styles) can change any property of the widget
+on_widget_invalidated(_forget_property_values)
+
+async def _set_property_by_handle(params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Set a widget property through a plugin-side handle resolved once per property.
+    
+    The first write to a property sends resolve_widget_property and remembers the returned
+    handle; later writes send set_widget_property_by_handle so Unreal skips the reflection
+    lookup. Returns None when the plugin has no handle commands or the handle failed (it is
+    then forgotten), in which case the caller sets the property by name.
+    """
+    global _property_handles_unsupported
+    if _property_handles_unsupported:
+        return None
+    
+    key = (params["widget_name"], params["component_name"], params["property_name"])
+    try:
+        handle = _property_handles.get(key)
+        if handle is None:
+            async with get_shared_pool().acquire() as unreal:
+                response = await unreal.send_command("resolve_widget_property", {
+                    "widget_name": params["widget_name"],
+                    "component_name": params["component_name"],
+                    "property_name": params["property_name"]
+                })
+            if not response or response.get("status") == "error" or response.get("success") is False:
+                if response and str(response.get("error", "")).startswith("Unknown command"):
+                    logger.info("Unreal does not support property handles; setting properties by name")
+                    _property_handles_unsupported = True
+                return None
+            
+            result = response.get("result") if isinstance(response.get("result"), dict) else response
+            handle = result.get("handle")
+            if handle is None:
+                # A plugin that resolves without handing out handles cannot use them either
+                _property_handles_unsupported = True
+                return None
+            _property_handles[key] = handle
+            if len(_property_handles) > PROPERTY_HANDLE_CACHE_SIZE:
+                _property_handles.popitem(last=False)
+        else:
+            _property_handles.move_to_end(key)
+        
+        response = await _batcher.submit("set_widget_property_by_handle", {
+            "widget_name": params["widget_name"],
+            "handle": handle,
+            "property_value": params["property_value"],
+            "property_type": params["property_type"]
+        })
+    except Exception as e:
+        logger.debug("Setting '%s' by handle failed: %s", params["property_name"], e)
+        return None
+    
+    if response and response.get("status") != "error" and response.get("success") is not False:
+        return response
+    
+    # Stale after a recompile or a removed component; resolve again on the next write
+    _property_handles.pop(key, None)
+    return None
+
+async def _send_property_write(command: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Set a widget property by handle when the plugin supports it, otherwise by name through the batcher."""
+    error = unknown_component_error(params)
+    if error:
+        return error
+    
+    # Writing the value the property was last set to is answered locally
+    key = (params["widget_name"], params["component_name"], params["property_name"])
+    value = (params["property_type"], params["property_value"])
+    last = _last_property_values.pop(key, None)
+    if last is not None and type(last[1]) is type(value[1]) and last == value:
+        _last_property_values[key] = last
+        logger.debug("'%s' on %s already has this value; not sending", params["property_name"], params["component_name"])
+        return {"success": True, "cached": True, "message": "Property already has this value"}
+    
+    response = await _set_property_by_handle(params)
+    if response is None:
+        response = await _batcher.submit(command, params)
+    
+    if response and response.get("status") != "error" and response.get("success") is not False:
+        _last_property_values[key] = value
+        if len(_last_property_values) > PROPERTY_VALUE_CACHE_SIZE:
+            _last_property_values.popitem(last=False)
+    return response
+
+async def _send_widget_create(command: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Submit a widget creation through the batcher; it may replace components whose values were remembered."""
+    _forget_property_values(params["widget_name"])
+    return await _batcher.submit(command, params)
+
 def register_umg_reflection_tools(mcp: FastMCP):
     """Register UMG reflection tools with the MCP server."""
 
     @mcp.tool()
+    @unreal_tool("get_available_widget_types", "getting available widget types", _cached_read)
     def get_available_widget_types() -> Dict[str, Any]:
         """
         Get all available widget types that can be created through reflection.
@@ -26,30 +221,11 @@ def register_umg_reflection_tools(mcp: FastMCP):
         Returns:
             Dict containing list of available widget types with metadata
         """
-        from unreal_mcp_server import get_unreal_connection
-        
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info("Getting available widget types")
-            response = unreal.send_command("get_available_widget_types", {})
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Available widget types response: {response}")
-            return response or {}
-            
-        except Exception as e:
-            error_msg = f"Error getting available widget types: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        logger.info("Getting available widget types")
+        return {}
 
     @mcp.tool()
+    @unreal_tool("create_widget_via_reflection", "creating widget via reflection", _send_widget_create)
     def create_widget_via_reflection(
         ctx: Context,
         widget_name: str,
@@ -72,37 +248,17 @@ def register_umg_reflection_tools(mcp: FastMCP):
         Returns:
             Dict containing widget creation confirmation and metadata
         """
-        from unreal_mcp_server import get_unreal_connection
+        logger.info("Creating widget via reflection: %s in %s", widget_type, widget_name)
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {
-                "widget_name": widget_name,
-                "widget_type": widget_type,
-                "parent_name": parent_name,
-                "properties": properties or {}
-            }
-            
-            logger.info(f"Creating widget via reflection: {widget_type} in {widget_name}")
-            response = unreal.send_command("create_widget_via_reflection", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Reflection widget creation response: {response}")
-            return response or {}
-            
-        except Exception as e:
-            error_msg = f"Error creating widget via reflection: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        return {
+            "widget_name": widget_name,
+            "widget_type": widget_type,
+            "parent_name": parent_name,
+            "properties": properties or {}
+        }
 
     @mcp.tool()
+    @unreal_tool("get_widget_type_info", "getting widget type info", _cached_read)
     def get_widget_type_info(
         ctx: Context,
         widget_type: str
@@ -119,39 +275,20 @@ def register_umg_reflection_tools(mcp: FastMCP):
         Returns:
             Dict containing detailed widget type information
         """
-        from unreal_mcp_server import get_unreal_connection
+        logger.info("Getting widget type info for: %s", widget_type)
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {"widget_type": widget_type}
-            
-            logger.info(f"Getting widget type info for: {widget_type}")
-            response = unreal.send_command("get_widget_type_info", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Widget type info response: {response}")
-            return response or {}
-            
-        except Exception as e:
-            error_msg = f"Error getting widget type info: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        return {"widget_type": widget_type}
 
     @mcp.tool()
+    @unreal_tool("set_widget_property_via_reflection", "setting widget property via reflection", _send_property_write)
     def set_widget_property_via_reflection(
         ctx: Context,
         widget_name: str,
         component_name: str,
         property_name: str,
         property_value: Any,
-        property_type: str = "auto"
+        property_type: str = "auto",
+        invalidate: bool = False
     ) -> Dict[str, Any]:
         """
         Set widget properties using reflection system.
@@ -165,42 +302,27 @@ def register_umg_reflection_tools(mcp: FastMCP):
             property_name: Name of the property to set
             property_value: Value to set (will be converted based on property_type)
             property_type: Type of the property ("auto", "string", "float", "bool", etc.)
+            invalidate: Send the write even if this value was the last one set, e.g. after the
+                        property was changed in the editor
             
         Returns:
-            Dict containing property setting confirmation
+            Dict containing property setting confirmation; "cached": True when the property
+            already had this value and nothing was sent
         """
-        from unreal_mcp_server import get_unreal_connection
+        logger.info("Setting widget property via reflection: %s on %s", property_name, component_name)
+        if invalidate:
+            _last_property_values.pop((widget_name, component_name, property_name), None)
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {
-                "widget_name": widget_name,
-                "component_name": component_name,
-                "property_name": property_name,
-                "property_value": property_value,
-                "property_type": property_type
-            }
-            
-            logger.info(f"Setting widget property via reflection: {property_name} on {component_name}")
-            response = unreal.send_command("set_widget_property_via_reflection", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Reflection property setting response: {response}")
-            return response or {}
-            
-        except Exception as e:
-            error_msg = f"Error setting widget property via reflection: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        return {
+            "widget_name": widget_name,
+            "component_name": component_name,
+            "property_name": property_name,
+            "property_value": property_value,
+            "property_type": property_type
+        }
 
     @mcp.tool()
+    @unreal_tool("get_widget_palette_info", "getting widget palette info", _cached_read)
     def get_widget_palette_info() -> Dict[str, Any]:
         """
         Get information about the UMG Widget Palette.
@@ -211,30 +333,11 @@ def register_umg_reflection_tools(mcp: FastMCP):
         Returns:
             Dict containing widget palette information organized by categories
         """
-        from unreal_mcp_server import get_unreal_connection
-        
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            logger.info("Getting widget palette information")
-            response = unreal.send_command("get_widget_palette_info", {})
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Widget palette info response: {response}")
-            return response or {}
-            
-        except Exception as e:
-            error_msg = f"Error getting widget palette info: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        logger.info("Getting widget palette information")
+        return {}
 
     @mcp.tool()
+    @unreal_tool("create_widget_from_palette", "creating widget from palette", _send_widget_create)
     def create_widget_from_palette(
         ctx: Context,
         widget_name: str,
@@ -257,35 +360,58 @@ def register_umg_reflection_tools(mcp: FastMCP):
         Returns:
             Dict containing widget creation confirmation
         """
-        from unreal_mcp_server import get_unreal_connection
+        logger.info("Creating widget from palette: %s in %s", palette_widget_name, widget_name)
         
-        try:
-            unreal = get_unreal_connection()
-            if not unreal:
-                logger.error("Failed to connect to Unreal Engine")
-                return {"success": False, "message": "Failed to connect to Unreal Engine"}
-            
-            params = {
-                "widget_name": widget_name,
-                "palette_widget_name": palette_widget_name,
-                "parent_name": parent_name,
-                "custom_properties": custom_properties or {}
-            }
-            
-            logger.info(f"Creating widget from palette: {palette_widget_name} in {widget_name}")
-            response = unreal.send_command("create_widget_from_palette", params)
-            
-            if not response:
-                logger.error("No response from Unreal Engine")
-                return {"success": False, "message": "No response from Unreal Engine"}
-            
-            logger.info(f"Palette widget creation response: {response}")
-            return response or {}
+        return {
+            "widget_name": widget_name,
+            "palette_widget_name": palette_widget_name,
+            "parent_name": parent_name,
+            "custom_properties": custom_properties or {}
+        }
+
+    # Reflection write tools that queue_reflection_operation can start, by name
+    queueable_tools = {tool.__name__: tool for tool in (
+        create_widget_via_reflection, set_widget_property_via_reflection, create_widget_from_palette
+    )}
+
+    @mcp.tool()
+    def queue_reflection_operation(
+        ctx: Context,
+        operation: str,
+        params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Start a reflection write without waiting for Unreal Engine to answer.
+        
+        Collect the result with await_operations; operations queued together share
+        batched round trips.
+        The params are checked and sent exactly as the matching tool would.
+        
+        Args:
+            operation: One of create_widget_via_reflection, set_widget_property_via_reflection,
+                       create_widget_from_palette
+            params: The parameters the matching tool takes
             
-        except Exception as e:
-            error_msg = f"Error creating widget from palette: {e}"
-            logger.error(error_msg)
-            return {"success": False, "message": error_msg}
+        Returns:
+            Dict containing the operation_id to pass to await_operations
+        """
+        if operation not in queueable_tools:
+            return {"success": False, "message": f"Unknown operation '{operation}'; expected one of {list(queueable_tools)}"}
+        return start_tool_operation(queueable_tools[operation], ctx, params)
+
+    @mcp.tool()
+    def invalidate_reflection_cache(ctx: Context) -> Dict[str, Any]:
+        """
+        Clear cached results of get_available_widget_types, get_widget_type_info and get_widget_palette_info.
+        
+        Use after enabling plugins or compiling code that adds new widget classes.
+        
+        Returns:
+            Response indicating success
+        """
+        _reflection_cache.clear()
+        logger.info("Reflection cache invalidated")
+        return {"success": True, "message": "Reflection cache cleared"}
 
     @mcp.tool()
     def get_reflection_guide() -> Dict[str, Any]:
@@ -295,40 +421,4 @@ def register_umg_reflection_tools(mcp: FastMCP):
         Returns:
             Dict containing reflection system guide with examples and best practices
         """
-        return {
-            "success": True,
-            "reflection_guide": {
-                "purpose": "Use Unreal's reflection system for generic widget creation and manipulation",
-                "advantages": [
-                    "Access to all UMG widget types",
-                    "Generic property setting without specific tool methods",
-                    "Future-proof against Unreal Engine updates",
-                    "Consistent with Unreal's internal widget creation patterns"
-                ],
-                "common_widget_types": {
-                    "layout": ["CanvasPanel", "VerticalBox", "HorizontalBox", "GridPanel", "ScrollBox"],
-                    "controls": ["Button", "CheckBox", "Slider", "ProgressBar", "EditableText"],
-                    "display": ["TextBlock", "RichTextBlock", "Image", "Border", "Spacer"],
-                    "input": ["EditableTextBox", "MultiLineEditableTextBox", "ComboBox", "ListBox"]
-                },
-                "best_practices": [
-                    "Use get_available_widget_types() to discover new widget types",
-                    "Check widget type info before creating complex widgets",
-                    "Use reflection for widgets not covered by specific tools",
-                    "Test reflection-created widgets thoroughly",
-                    "Document custom widget creation patterns"
-                ],
-                "workflow_examples": {
-                    "discover_widgets": [
-                        "1. Call get_available_widget_types()",
-                        "2. Browse widget categories",
-                        "3. Get detailed info with get_widget_type_info()"
-                    ],
-                    "create_custom_widget": [
-                        "1. Use create_widget_via_reflection()",
-                        "2. Set properties with set_widget_property_via_reflection()",
-                        "3. Test and validate the widget"
-                    ]
-                }
-            }
-        }
+        return REFLECTION_GUIDE
@@ -8,6 +8,7 @@ Includes style sets, theming systems, and comprehensive property management.
 import logging
 from typing import Dict, List, Any, Optional
 from mcp.server.fastmcp import FastMCP, Context
+from tools.umg_discovery import invalidate_widget_cache
 
 # Get logger
 logger = logging.getLogger("UnrealMCP")
@@ -111,6 +112,7 @@ def register_umg_styling_tools(mcp: FastMCP):
             
             logger.info(f"Applying theme {theme_name} to {component_name} in {widget_name}")
             response = unreal.send_command("apply_widget_theme", params)
+            invalidate_widget_cache(params.get("widget_name"))
             
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -161,6 +163,7 @@ def register_umg_styling_tools(mcp: FastMCP):
             
             logger.info(f"Setting widget style for {component_name} in {widget_name}")
             response = unreal.send_command("set_widget_style", params)
+            invalidate_widget_cache(params.get("widget_name"))
             
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -217,6 +220,7 @@ def register_umg_styling_tools(mcp: FastMCP):
             
             logger.info(f"Setting slot properties for {widget_component_name} in {widget_name}")
             response = unreal.send_command("set_widget_slot_properties", params)
+            invalidate_widget_cache(params.get("widget_name"))
             
             if not response:
                 logger.error("No response from Unreal Engine")
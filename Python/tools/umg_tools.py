@@ -8,6 +8,7 @@ Supports a wide range of widget components, layout management, styling, and even
 import logging
 from typing import Dict, List, Any, Optional
 from mcp.server.fastmcp import FastMCP, Context
+from tools.umg_discovery import invalidate_widget_cache
 
 # Get logger
 logger = logging.getLogger("UnrealMCP")
@@ -49,6 +50,7 @@ def register_umg_tools(mcp: FastMCP):
             
             logger.info(f"Creating UMG Widget Blueprint with params: {params}")
             response = unreal.send_command("create_umg_widget_blueprint", params)
+            invalidate_widget_cache(params.get("widget_name"))
             
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -108,6 +110,7 @@ def register_umg_tools(mcp: FastMCP):
             
             logger.info(f"Adding Text Block to widget with params: {params}")
             response = unreal.send_command("add_text_block_to_widget", params)
+            invalidate_widget_cache(params.get("widget_name"))
             
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -170,6 +173,7 @@ def register_umg_tools(mcp: FastMCP):
             
             logger.info(f"Adding Button to widget with params: {params}")
             response = unreal.send_command("add_button_to_widget", params)
+            invalidate_widget_cache(params.get("widget_name"))
             
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -224,6 +228,7 @@ def register_umg_tools(mcp: FastMCP):
             
             logger.info(f"Binding widget event with params: {params}")
             response = unreal.send_command("bind_widget_event", params)
+            invalidate_widget_cache(params.get("widget_name"))
             
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -268,6 +273,7 @@ def register_umg_tools(mcp: FastMCP):
             
             logger.info(f"Adding widget to viewport with params: {params}")
             response = unreal.send_command("add_widget_to_viewport", params)
+            invalidate_widget_cache(params.get("widget_name"))
             
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -318,6 +324,7 @@ def register_umg_tools(mcp: FastMCP):
             
             logger.info(f"Setting text block binding with params: {params}")
             response = unreal.send_command("set_text_block_binding", params)
+            invalidate_widget_cache(params.get("widget_name"))
             
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -377,6 +384,7 @@ def register_umg_tools(mcp: FastMCP):
             
             logger.info(f"Adding Image to widget with params: {params}")
             response = unreal.send_command("add_image_to_widget", params)
+            invalidate_widget_cache(params.get("widget_name"))
             
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -436,6 +444,7 @@ def register_umg_tools(mcp: FastMCP):
             
             logger.info(f"Adding Progress Bar to widget with params: {params}")
             response = unreal.send_command("add_progress_bar_to_widget", params)
+            invalidate_widget_cache(params.get("widget_name"))
             
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -498,6 +507,7 @@ def register_umg_tools(mcp: FastMCP):
             
             logger.info(f"Adding Slider to widget with params: {params}")
             response = unreal.send_command("add_slider_to_widget", params)
+            invalidate_widget_cache(params.get("widget_name"))
             
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -554,6 +564,7 @@ def register_umg_tools(mcp: FastMCP):
             
             logger.info(f"Adding CheckBox to widget with params: {params}")
             response = unreal.send_command("add_checkbox_to_widget", params)
+            invalidate_widget_cache(params.get("widget_name"))
             
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -613,6 +624,7 @@ def register_umg_tools(mcp: FastMCP):
             
             logger.info(f"Adding ComboBox to widget with params: {params}")
             response = unreal.send_command("add_combo_box_to_widget", params)
+            invalidate_widget_cache(params.get("widget_name"))
             
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -666,6 +678,7 @@ def register_umg_tools(mcp: FastMCP):
             
             logger.info(f"Adding VerticalBox to widget with params: {params}")
             response = unreal.send_command("add_vertical_box_to_widget", params)
+            invalidate_widget_cache(params.get("widget_name"))
             
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -719,6 +732,7 @@ def register_umg_tools(mcp: FastMCP):
             
             logger.info(f"Adding HorizontalBox to widget with params: {params}")
             response = unreal.send_command("add_horizontal_box_to_widget", params)
+            invalidate_widget_cache(params.get("widget_name"))
             
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -775,6 +789,7 @@ def register_umg_tools(mcp: FastMCP):
             
             logger.info(f"Setting widget anchors with params: {params}")
             response = unreal.send_command("set_widget_anchors", params)
+            invalidate_widget_cache(params.get("widget_name"))
             
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -822,6 +837,7 @@ def register_umg_tools(mcp: FastMCP):
             
             logger.info(f"Setting widget visibility with params: {params}")
             response = unreal.send_command("set_widget_visibility", params)
+            invalidate_widget_cache(params.get("widget_name"))
             
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -907,6 +923,7 @@ def register_umg_tools(mcp: FastMCP):
             
             logger.info(f"Removing widget from blueprint with params: {params}")
             response = unreal.send_command("remove_widget_from_blueprint", params)
+            invalidate_widget_cache(params.get("widget_name"))
             
             if not response:
                 logger.error("No response from Unreal Engine")
@@ -18,7 +18,7 @@ Features:
 
 Architecture:
 - FastMCP framework with async context management
-- Connection-per-command pattern (Unreal closes after each operation)
+- One persistent connection shared by all tools (the plugin serves one client at a time)
 - Comprehensive error handling and logging
 - Modular tool registration system
 - Configuration-driven behavior with validation
@@ -32,14 +32,30 @@ Usage:
 For complete tool documentation, use the info() prompt.
 """
 
+import asyncio
 import logging
+import select
 import socket
 import sys
+import threading
 import json
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 from mcp.server.fastmcp import FastMCP
 
+# orjson is optional; the stdlib codec is used when it is not installed
+try:
+    import orjson
+    
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON."""
+        return json.dumps(obj).encode('utf-8')
+    
+    json_loads = json.loads
+
 # Initialize logger first (will be reconfigured after config load)
 logger = logging.getLogger("UnrealMCP")
 
@@ -129,6 +145,11 @@ class UnrealConnection:
         """Initialize the connection."""
         self.socket = None
         self.connected = False
+        # Set once the plugin rejects the "batch" command
+        self.batch_unsupported = False
+        # Held for each connect and command; sync tools on the event loop and async tools in
+        # worker threads share this socket, and the plugin serves one client at a time
+        self.lock = threading.Lock()
     
     def connect(self) -> bool:
         """Connect to the Unreal Engine instance."""
@@ -167,6 +188,17 @@ class UnrealConnection:
             self.connected = False
             return False
     
+    def is_healthy(self) -> bool:
+        """Whether the socket is open and idle, with the plugin's end still connected."""
+        if not self.socket:
+            return False
+        try:
+            # An idle socket that polls readable is either at EOF or holds stray bytes; neither is reusable
+            readable, _, _ = select.select([self.socket], [], [], 0)
+            return not readable
+        except (OSError, ValueError):
+            return False
+    
     def disconnect(self):
         """Disconnect from the Unreal Engine instance."""
         if self.socket:
@@ -177,29 +209,29 @@ class UnrealConnection:
         self.socket = None
         self.connected = False
 
-    def receive_full_response(self, sock, buffer_size=4096) -> bytes:
-        """Receive a complete response from Unreal, handling chunked data."""
-        chunks = []
+    def receive_full_response(self, sock, buffer_size=65536) -> Dict[str, Any]:
+        """Receive a complete response from Unreal, handling chunked data, and return it decoded."""
+        data = bytearray()
         sock.settimeout(5)  # 5 second timeout
         try:
             while True:
                 chunk = sock.recv(buffer_size)
                 if not chunk:
-                    if not chunks:
-                        raise Exception("Connection closed before receiving data")
+                    if not data:
+                        raise ConnectionError("Connection closed before receiving data")
                     break
-                chunks.append(chunk)
+                data += chunk
                 
-                # Process the data received so far
-                data = b''.join(chunks)
-                decoded_data = data.decode('utf-8')
+                # Replies are JSON objects, so decoding is only attempted once the data ends with '}'
+                if not data[-64:].rstrip().endswith(b"}"):
+                    continue
                 
-                # Try to parse as JSON to check if complete
+                # Try to parse as JSON to check if complete; the parsed reply is the result
                 try:
-                    json.loads(decoded_data)
-                    logger.info(f"Received complete response ({len(data)} bytes)")
-                    return data
-                except json.JSONDecodeError:
+                    response = json_loads(data)
+                    logger.info("Received complete response (%d bytes)", len(data))
+                    return response
+                except ValueError:
                     # Not complete JSON yet, continue reading
                     logger.debug(f"Received partial response, waiting for more data...")
                     continue
@@ -208,13 +240,12 @@ class UnrealConnection:
                     continue
         except socket.timeout:
             logger.warning("Socket timeout during receive")
-            if chunks:
+            if data:
                 # If we have some data already, try to use it
-                data = b''.join(chunks)
                 try:
-                    json.loads(data.decode('utf-8'))
+                    response = json_loads(data)
                     logger.info(f"Using partial response after timeout ({len(data)} bytes)")
-                    return data
+                    return response
                 except:
                     pass
             raise Exception("Timeout receiving Unreal response")
@@ -222,19 +253,41 @@ class UnrealConnection:
             logger.error(f"Error during receive: {str(e)}")
             raise
     
-    def send_command(self, command: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
-        """Send a command to Unreal Engine and get the response."""
-        # Always reconnect for each command, since Unreal closes the connection after each command
-        # This is different from Unity which keeps connections alive
-        if self.socket:
-            try:
-                self.socket.close()
-            except:
-                pass
-            self.socket = None
-            self.connected = False
+    @staticmethod
+    def normalize_response(response: Dict[str, Any]) -> Dict[str, Any]:
+        """Log a decoded Unreal response and convert error variants to the standard format."""
+        # Log complete response for debugging
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Complete response from Unreal: %s", response)
+        
+        # Check for both error formats: {"status": "error", ...} and {"success": false, ...}
+        if response.get("status") == "error":
+            error_message = response.get("error") or response.get("message", "Unknown Unreal error")
+            logger.error(f"Unreal error (status=error): {error_message}")
+            # We want to preserve the original error structure but ensure error is accessible
+            if "error" not in response:
+                response["error"] = error_message
+        elif response.get("success") is False:
+            # This format uses {"success": false, "error": "message"} or {"success": false, "message": "message"}
+            error_message = response.get("error") or response.get("message", "Unknown Unreal error")
+            logger.error(f"Unreal error (success=false): {error_message}")
+            # Convert to the standard format expected by higher layers
+            response = {
+                "status": "error",
+                "error": error_message
+            }
         
-        if not self.connect():
+        return response
+    
+    def _exchange(self, command_json: bytes) -> Dict[str, Any]:
+        """Send an encoded command on the open socket and read the decoded response."""
+        self.socket.sendall(command_json)
+        return self.receive_full_response(self.socket)
+    
+    def _send_locked(self, command: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+        """Send a command with the lock held; returns None if Unreal is unreachable and raises on transport errors."""
+        # Reuse the open socket; the plugin keeps serving a client until it disconnects
+        if not self.is_healthy() and not self.connect():
             logger.error("Failed to connect to Unreal Engine for command")
             return None
         
@@ -246,90 +299,149 @@ class UnrealConnection:
             }
             
             # Send without newline, exactly like Unity
-            command_json = json.dumps(command_obj)
-            logger.info(f"Sending command: {command_json}")
-            self.socket.sendall(command_json.encode('utf-8'))
-            
-            # Read response using improved handler
-            response_data = self.receive_full_response(self.socket)
-            response = json.loads(response_data.decode('utf-8'))
+            command_json = json_dumps(command_obj)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Sending command: %s", command_json.decode('utf-8'))
             
-            # Log complete response for debugging
-            logger.info(f"Complete response from Unreal: {response}")
-            
-            # Check for both error formats: {"status": "error", ...} and {"success": false, ...}
-            if response.get("status") == "error":
-                error_message = response.get("error") or response.get("message", "Unknown Unreal error")
-                logger.error(f"Unreal error (status=error): {error_message}")
-                # We want to preserve the original error structure but ensure error is accessible
-                if "error" not in response:
-                    response["error"] = error_message
-            elif response.get("success") is False:
-                # This format uses {"success": false, "error": "message"} or {"success": false, "message": "message"}
-                error_message = response.get("error") or response.get("message", "Unknown Unreal error")
-                logger.error(f"Unreal error (success=false): {error_message}")
-                # Convert to the standard format expected by higher layers
-                response = {
-                    "status": "error",
-                    "error": error_message
-                }
-            
-            # Always close the connection after command is complete
-            # since Unreal will close it on its side anyway
             try:
-                self.socket.close()
-            except:
-                pass
-            self.socket = None
-            self.connected = False
+                response = self._exchange(command_json)
+            except (ConnectionError, BrokenPipeError) as e:
+                # The plugin can drop the connection between the health check and the send; retry once
+                logger.warning(f"Connection to Unreal lost ({e}), reconnecting")
+                if not self.connect():
+                    raise
+                response = self._exchange(command_json)
             
-            return response
+            return self.normalize_response(response)
             
-        except Exception as e:
-            logger.error(f"Error sending command: {e}")
-            # Always reset connection state on any error
-            self.connected = False
+        except Exception:
+            # Drop the connection on any error; the next command reconnects
+            self.disconnect()
+            raise
+    
+    def send_command(self, command: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+        """Send a command to Unreal Engine and get the response."""
+        with self.lock:
             try:
-                self.socket.close()
-            except:
-                pass
-            self.socket = None
-            return {
-                "status": "error",
-                "error": str(e)
-            }
+                return self._send_locked(command, params)
+            except Exception as e:
+                logger.error(f"Error sending command: {e}")
+                return {
+                    "status": "error",
+                    "error": str(e)
+                }
+    
+    def send_command_raising(self, command: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Send a command and return the normalized response; raises on connection and transport errors."""
+        with self.lock:
+            response = self._send_locked(command, params)
+        if response is None:
+            raise ConnectionError("Failed to connect to Unreal Engine")
+        return response
+
+    def send_batch(self, commands: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Send several commands in one "batch" request and return their responses in order.
+        
+        The request is {"commands": [{"name": ..., "params": ...}, ...]} and the plugin answers
+        with a "results" list. If the plugin does not know "batch" (remembered for later calls)
+        or the batch fails, each command is sent on its own instead.
+        """
+        if not self.batch_unsupported:
+            response = self.send_command("batch", self._batch_params(commands))
+            if response is None:
+                # Unreachable; sending each command would only retry the connect
+                return [None] * len(commands)
+            results = self._batch_results(response, len(commands))
+            if results is not None:
+                return results
+        
+        return [self.send_command(name, params) for name, params in commands]
+    
+    @staticmethod
+    def _batch_params(commands: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """Build the params of a "batch" command."""
+        return {"commands": [{"name": name, "params": params} for name, params in commands]}
+    
+    def _batch_results(self, response: Optional[Dict[str, Any]], count: int) -> Optional[List[Dict[str, Any]]]:
+        """Return the per-command results of a "batch" response, or None if they must be sent individually."""
+        if response and str(response.get("error", "")).startswith("Unknown command"):
+            logger.info("Unreal does not support 'batch'; sending commands individually")
+            self.batch_unsupported = True
+        elif response and response.get("status") != "error":
+            result = response.get("result")
+            results = result.get("results") if isinstance(result, dict) else response.get("results")
+            if isinstance(results, list) and len(results) == count:
+                return results
+        return None
+
+class PooledUnrealConnection:
+    """Async view of the shared UnrealConnection; each command runs in a worker thread."""
+    
+    def __init__(self, connection: UnrealConnection):
+        """Wrap the shared blocking connection."""
+        self.connection = connection
+    
+    async def send_command(self, command: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Send a command and return the normalized response; raises on transport errors."""
+        return await asyncio.to_thread(self.connection.send_command_raising, command, params)
+    
+    async def send_batch(self, commands: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[Dict[str, Any]]]:
+        """Run UnrealConnection.send_batch in a worker thread; a None entry means Unreal was unreachable."""
+        return await asyncio.to_thread(self.connection.send_batch, commands)
+
+class UnrealConnectionPool:
+    """
+    Async access to the one connection the Unreal plugin serves.
+    
+    The plugin serves one client at a time, so async tools use the same socket as the
+    blocking send_command path instead of opening their own. acquire() admits one async
+    caller at a time, and the connection's lock orders it against sync tools: a sync tool
+    that arrives mid-command waits for that reply, which the worker thread reads without
+    needing the event loop.
+    """
+    
+    def __init__(self):
+        """Create the pool; the connection itself is opened on first use."""
+        self._lock = asyncio.Lock()
+    
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[PooledUnrealConnection]:
+        """Borrow the shared connection for async commands."""
+        async with self._lock:
+            yield PooledUnrealConnection(_get_shared_connection())
+
+# Async access to the shared connection
+_connection_pool = UnrealConnectionPool()
+
+def get_connection_pool() -> UnrealConnectionPool:
+    """Get the async access point to the shared connection used by async tools."""
+    return _connection_pool
 
 # Global connection state
 _unreal_connection: UnrealConnection = None
 
+def _get_shared_connection() -> UnrealConnection:
+    """Get the shared connection object without connecting it."""
+    global _unreal_connection
+    if _unreal_connection is None:
+        _unreal_connection = UnrealConnection()
+    return _unreal_connection
+
 def get_unreal_connection() -> Optional[UnrealConnection]:
     """Get the connection to Unreal Engine."""
-    global _unreal_connection
     try:
-        if _unreal_connection is None:
-            _unreal_connection = UnrealConnection()
-            if not _unreal_connection.connect():
+        connection = _get_shared_connection()
+        
+        # An async command may be using the socket in a worker thread; wait for it to finish
+        with connection.lock:
+            if connection.is_healthy():
+                logger.debug("Reusing existing Unreal connection")
+            elif not connection.connect():
                 logger.warning("Could not connect to Unreal Engine")
-                _unreal_connection = None
-        else:
-            # Verify connection is still valid with a ping-like test
-            try:
-                # Simple test by sending an empty buffer to check if socket is still connected
-                _unreal_connection.socket.sendall(b'\x00')
-                logger.debug("Connection verified with ping test")
-            except Exception as e:
-                logger.warning(f"Existing connection failed: {e}")
-                _unreal_connection.disconnect()
-                _unreal_connection = None
-                # Try to reconnect
-                _unreal_connection = UnrealConnection()
-                if not _unreal_connection.connect():
-                    logger.warning("Could not reconnect to Unreal Engine")
-                    _unreal_connection = None
-                else:
-                    logger.info("Successfully reconnected to Unreal Engine")
+                return None
         
-        return _unreal_connection
+        return connection
     except Exception as e:
         logger.error(f"Error getting Unreal connection: {e}")
         return None
@@ -350,20 +462,19 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
     
     # Initialize Unreal connection
     try:
-        _unreal_connection = get_unreal_connection()
-        if _unreal_connection:
+        if get_unreal_connection():
             logger.info("Connected to Unreal Engine on startup")
         else:
             logger.warning("Could not connect to Unreal Engine on startup")
     except Exception as e:
         logger.error(f"Error connecting to Unreal Engine on startup: {e}")
-        _unreal_connection = None
     
     try:
         yield {}
     finally:
         if _unreal_connection:
-            _unreal_connection.disconnect()
+            with _unreal_connection.lock:
+                _unreal_connection.disconnect()
             _unreal_connection = None
         logger.info("Unreal MCP server shut down")
 